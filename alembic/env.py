@@ -8,6 +8,8 @@ from backend.models.menu_items import MenuItem
 from backend.models.orders import Order
 from backend.models.users import User
 from backend.models.order_items import OrderItem
+from backend.models.sales_rollups import SalesRollup
+from backend.models.order_rollups import OrderRollup
 
 from alembic import context
 
@@ -21,10 +23,13 @@ target_metadata = Base.metadata
 
 def run_migrations_online():
     """Run migrations in 'online' mode with proper connection handling."""
-    with engine.begin() as connection:
+    # Let alembic own the transaction, so migrations can step out of it with
+    # autocommit_block() (e.g. for CREATE INDEX CONCURRENTLY).
+    with engine.connect() as connection:
         context.configure(connection=connection,
                           target_metadata=target_metadata)
-        context.run_migrations()
+        with context.begin_transaction():
+            context.run_migrations()
 
 
 run_migrations_online()
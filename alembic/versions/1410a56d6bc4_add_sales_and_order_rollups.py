@@ -0,0 +1,52 @@
+"""Add sales and order rollups
+
+Revision ID: 1410a56d6bc4
+Revises: d841fa8e92af
+Create Date: 2026-10-17 14:20:11.318402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1410a56d6bc4'
+down_revision: Union[str, None] = 'd841fa8e92af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The primary keys lead with (restaurant_id, granularity, bucket_start),
+    # which serves the analytics range scans. Fill with
+    # `python -m scripts.backfill_rollups` after upgrading.
+    op.create_table('sales_rollups',
+                    sa.Column('restaurant_id', sa.UUID(), nullable=False),
+                    sa.Column('granularity', sa.String(), nullable=False),
+                    sa.Column('bucket_start', sa.TIMESTAMP(), nullable=False),
+                    sa.Column('menu_item_id', sa.UUID(), nullable=False),
+                    sa.Column('quantity', sa.Integer(), nullable=False),
+                    sa.Column('revenue', sa.DECIMAL(precision=12, scale=2), nullable=False),
+                    sa.Column('order_count', sa.Integer(), nullable=False),
+                    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+                    sa.ForeignKeyConstraint(['menu_item_id'], ['menu_items.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('restaurant_id', 'granularity', 'bucket_start', 'menu_item_id')
+                    )
+    op.create_table('order_rollups',
+                    sa.Column('restaurant_id', sa.UUID(), nullable=False),
+                    sa.Column('granularity', sa.String(), nullable=False),
+                    sa.Column('bucket_start', sa.TIMESTAMP(), nullable=False),
+                    sa.Column('order_count', sa.Integer(), nullable=False),
+                    sa.Column('revenue', sa.DECIMAL(precision=12, scale=2), nullable=False),
+                    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('restaurant_id', 'granularity', 'bucket_start')
+                    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('order_rollups')
+    op.drop_table('sales_rollups')
@@ -0,0 +1,37 @@
+"""Keep order items of deleted menu items
+
+Revision ID: 239ceea8824b
+Revises: 93fa3d6f7729
+Create Date: 2026-10-17 18:20:11.604381
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '239ceea8824b'
+down_revision: Union[str, None] = '93fa3d6f7729'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Deleting a menu item used to delete the order lines that referenced it,
+    # changing past orders; now the lines stay with menu_item_id NULL.
+    op.drop_constraint('order_items_menu_item_id_fkey', 'order_items',
+                       type_='foreignkey')
+    op.create_foreign_key('order_items_menu_item_id_fkey', 'order_items',
+                          'menu_items', ['menu_item_id'], ['id'],
+                          ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('order_items_menu_item_id_fkey', 'order_items',
+                       type_='foreignkey')
+    op.create_foreign_key('order_items_menu_item_id_fkey', 'order_items',
+                          'menu_items', ['menu_item_id'], ['id'],
+                          ondelete='CASCADE')
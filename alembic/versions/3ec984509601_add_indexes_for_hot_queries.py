@@ -0,0 +1,67 @@
+"""Add indexes for hot queries
+
+Revision ID: 3ec984509601
+Revises: 16dfd0e619b1
+Create Date: 2026-10-17 11:40:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3ec984509601'
+down_revision: Union[str, None] = '16dfd0e619b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and a plain
+    # CREATE INDEX would block writes to orders for the whole build.
+    with op.get_context().autocommit_block():
+        # Restaurant-wide order list
+        op.create_index('ix_orders_restaurant_id_created_at', 'orders',
+                        ['restaurant_id', 'created_at'],
+                        postgresql_concurrently=True)
+        # get_orders_by_status
+        op.create_index('ix_orders_restaurant_id_status_created_at', 'orders',
+                        ['restaurant_id', 'status', 'created_at'],
+                        postgresql_concurrently=True)
+        # get_orders for a single user
+        op.create_index('ix_orders_restaurant_id_user_id_created_at', 'orders',
+                        ['restaurant_id', 'user_id', 'created_at'],
+                        postgresql_concurrently=True)
+        # get_menu
+        op.create_index('ix_menu_items_restaurant_id_created_at', 'menu_items',
+                        ['restaurant_id', 'created_at'],
+                        postgresql_concurrently=True)
+        # Order items lookup by order
+        op.create_index('ix_order_items_order_id', 'order_items', ['order_id'],
+                        postgresql_concurrently=True)
+        # get_users
+        op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'],
+                        postgresql_concurrently=True)
+        # get_users_by_type
+        op.create_index('ix_users_user_type_created_at', 'users',
+                        ['user_type', 'created_at'],
+                        postgresql_concurrently=True)
+    # The /login/ email lookup is already served by the unique constraint
+    # on users.email created in the initial migration.
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table in (
+                ('ix_users_user_type_created_at', 'users'),
+                ('ix_users_created_at_id', 'users'),
+                ('ix_order_items_order_id', 'order_items'),
+                ('ix_menu_items_restaurant_id_created_at', 'menu_items'),
+                ('ix_orders_restaurant_id_user_id_created_at', 'orders'),
+                ('ix_orders_restaurant_id_status_created_at', 'orders'),
+                ('ix_orders_restaurant_id_created_at', 'orders')):
+            op.drop_index(name, table_name=table,
+                          postgresql_concurrently=True)
@@ -0,0 +1,34 @@
+"""Keep sales rollups of deleted menu items
+
+Revision ID: 64b24860478e
+Revises: 239ceea8824b
+Create Date: 2026-10-17 18:41:53.228190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '64b24860478e'
+down_revision: Union[str, None] = '239ceea8824b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Deleting a menu item used to delete its sales history, while
+    # order_rollups kept the revenue; the rollups now keep the item's id.
+    op.drop_constraint('sales_rollups_menu_item_id_fkey', 'sales_rollups',
+                       type_='foreignkey')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM sales_rollups WHERE menu_item_id NOT IN "
+               "(SELECT id FROM menu_items)")
+    op.create_foreign_key('sales_rollups_menu_item_id_fkey', 'sales_rollups',
+                          'menu_items', ['menu_item_id'], ['id'],
+                          ondelete='CASCADE')
@@ -0,0 +1,65 @@
+"""Add item_count and total_amount to orders
+
+Revision ID: 93fa3d6f7729
+Revises: 1410a56d6bc4
+Create Date: 2026-10-17 16:02:37.540193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '93fa3d6f7729'
+down_revision: Union[str, None] = '1410a56d6bc4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10_000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default is stored in the catalog, so adding the columns
+    # does not rewrite the table.
+    op.add_column('orders', sa.Column(
+        'item_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('orders', sa.Column(
+        'total_amount', sa.DECIMAL(precision=10, scale=2), server_default='0',
+        nullable=False))
+
+    # Backfill in ranges of BATCH_SIZE order ids, each read through the
+    # order_items.order_id index, so no statement touches the whole table.
+    # The autocommit block first commits the new columns, then commits every
+    # batch on its own, so row locks are held for one batch at a time rather
+    # than until the whole table is done.
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        lower = '00000000-0000-0000-0000-000000000000'
+        while True:
+            upper = connection.execute(sa.text(
+                "SELECT id FROM orders WHERE id > CAST(:lower AS uuid) "
+                "ORDER BY id OFFSET :offset LIMIT 1"
+            ), {"lower": lower, "offset": BATCH_SIZE - 1}).scalar()
+            upper_bound = "AND order_id <= CAST(:upper AS uuid)" if upper else ""
+            connection.execute(sa.text(
+                "UPDATE orders "
+                "SET item_count = totals.item_count, total_amount = totals.total_amount "
+                "FROM (SELECT order_id, sum(quantity) AS item_count, "
+                "             sum(quantity * price) AS total_amount "
+                "      FROM order_items "
+                f"      WHERE order_id > CAST(:lower AS uuid) {upper_bound} "
+                "      GROUP BY order_id) AS totals "
+                "WHERE orders.id = totals.order_id"
+            ), {"lower": lower, "upper": upper})
+            if upper is None:
+                break
+            lower = str(upper)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('orders', 'total_amount')
+    op.drop_column('orders', 'item_count')
@@ -0,0 +1,34 @@
+"""Add created_at to restaurants
+
+Revision ID: d841fa8e92af
+Revises: 3ec984509601
+Create Date: 2026-10-17 12:05:47.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd841fa8e92af'
+down_revision: Union[str, None] = '3ec984509601'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows get the migration time; new rows are set by the model.
+    op.add_column('restaurants', sa.Column(
+        'created_at', sa.TIMESTAMP(), server_default=sa.func.now(),
+        nullable=True))
+    op.create_index('ix_restaurants_created_at', 'restaurants',
+                    ['created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_restaurants_created_at', table_name='restaurants')
+    op.drop_column('restaurants', 'created_at')
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+
+from backend.cache import menu_cache
+from backend.database import engine, pool_stats
+from backend.security import hash_metrics, require_user_type
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin Endpoints"],
+    dependencies=[Depends(require_user_type(["admin"]))]
+)
+
+
+@router.get("/cache/menu")
+async def get_menu_cache_stats():
+    """Report menu cache size and hit/miss counters for this worker."""
+    return menu_cache.stats()
+
+
+@router.get("/security/password-hashing")
+async def get_password_hashing_stats():
+    """Report password hashing pool load, latency and queue wait."""
+    return hash_metrics.stats()
+
+
+@router.get("/db/pool")
+async def get_db_pool_stats():
+    """Report live connection pool usage, checkout waits and churn for this worker."""
+    return pool_stats.stats(engine.sync_engine.pool)
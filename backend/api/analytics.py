@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from backend.database import get_db
+from backend.models.menu_items import MenuItem
+from backend.models.order_rollups import OrderRollup
+from backend.models.sales_rollups import SalesRollup
+from backend.schemas.analytics import SalesBucket, TopMenuItem
+from backend.security import require_user_type
+
+from uuid import UUID
+
+MAX_BUCKETS = 1000
+BUCKET_LENGTH = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+router = APIRouter(
+    prefix="/restaurants/{restaurant_id}/analytics",
+    tags=["Analytics Endpoints"],
+    dependencies=[Depends(require_user_type(["admin", "restaurant_worker"]))]
+)
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Converts an aware datetime to naive UTC, the time zone of stored timestamps."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class RollupRange:
+    """Query parameters selecting the rollup buckets to read.
+
+    Buckets are cut from the orders' created_at, which is stored as UTC
+    without a time zone (see backend.models.base.utcnow), so hours and days
+    are UTC hours and days. Bounds given with an offset are converted to
+    UTC; bounds without one are taken as UTC.
+    """
+
+    def __init__(
+        self,
+        start: datetime = Query(..., description="First bucket, inclusive"),
+        end: datetime = Query(..., description="End of the range, exclusive"),
+        granularity: Literal["hour", "day"] = "day",
+    ):
+        start, end = to_naive_utc(start), to_naive_utc(end)
+        if end <= start:
+            raise HTTPException(status_code=400, detail="end must be after start")
+        if (end - start) / BUCKET_LENGTH[granularity] > MAX_BUCKETS:
+            raise HTTPException(
+                status_code=400, detail=f"Range spans more than {MAX_BUCKETS} buckets")
+        self.start = start
+        self.end = end
+        self.granularity = granularity
+
+
+@router.get("/sales", response_model=list[SalesBucket])
+async def get_sales(
+    restaurant_id: UUID,
+    buckets: RollupRange = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """Completed orders and revenue per hour or day.
+
+    Buckets without completed orders are omitted.
+    """
+    result = await db.execute(
+        select(OrderRollup.bucket_start, OrderRollup.order_count, OrderRollup.revenue)
+        .where(OrderRollup.restaurant_id == restaurant_id)
+        .where(OrderRollup.granularity == buckets.granularity)
+        .where(OrderRollup.bucket_start >= buckets.start)
+        .where(OrderRollup.bucket_start < buckets.end)
+        .order_by(OrderRollup.bucket_start)
+    )
+    return result.mappings().all()
+
+
+@router.get("/top-items", response_model=list[TopMenuItem])
+async def get_top_items(
+    restaurant_id: UUID,
+    buckets: RollupRange = Depends(),
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """Best-selling menu items by quantity over the range.
+
+    Items deleted from the menu since are included, without a name. Lines
+    whose item was deleted before the order was completed count toward
+    /sales revenue but not here, as they have no item to attribute them to.
+    """
+    quantity = func.sum(SalesRollup.quantity).label("quantity")
+    result = await db.execute(
+        select(
+            SalesRollup.menu_item_id,
+            MenuItem.name,
+            quantity,
+            func.sum(SalesRollup.revenue).label("revenue"),
+            func.sum(SalesRollup.order_count).label("order_count"),
+        )
+        .outerjoin(MenuItem, MenuItem.id == SalesRollup.menu_item_id)
+        .where(SalesRollup.restaurant_id == restaurant_id)
+        .where(SalesRollup.granularity == buckets.granularity)
+        .where(SalesRollup.bucket_start >= buckets.start)
+        .where(SalesRollup.bucket_start < buckets.end)
+        .group_by(SalesRollup.menu_item_id, MenuItem.name)
+        .order_by(quantity.desc())
+        .limit(limit)
+    )
+    return result.mappings().all()
@@ -1,14 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from backend.cache import menu_cache
 from backend.database import get_db
+from backend.etag import conditional_response, make_etag
+from backend.menu_import import (
+    CSV_CONTENT_TYPES, NDJSON_CONTENT_TYPES, LineTooLong, iter_lines, iter_records,
+    validate_record
+)
+from backend.pagination import PageParams, paginate, schema_columns
+from backend.responses import PydanticJSONResponse
 from backend.models.menu_items import MenuItem
-from backend.schemas.menu_items import MenuItemCreate, MenuItemUpdate
+from backend.schemas.menu_items import MenuImportResult, MenuItemCreate, MenuItemUpdate
+from backend.schemas.pagination import Page
 from backend.security import require_user_type
 
 from uuid import UUID
 
+IMPORT_BATCH_SIZE = 500
+MAX_REPORTED_IMPORT_ERRORS = 100
+
 router = APIRouter(
     prefix="/restaurants/{restaurant_id}/menu_items",
     tags=["Menu Items Endpoints"],
@@ -16,21 +29,51 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=list[MenuItemUpdate])
-async def get_menu(restaurant_id: UUID, db: AsyncSession = Depends(get_db)):
-    """Retrieve all menu items."""
-    result = await db.execute(select(MenuItem).where(MenuItem.restaurant_id == restaurant_id))
-    menu_items = result.scalars().all()
-    return menu_items
+@router.get("/", response_model=Page[MenuItemUpdate])
+async def get_menu(
+    restaurant_id: UUID,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """Retrieve a page of menu items, served from the menu cache when possible."""
+    cache_key = (page.cursor, page.limit)
+    cached = menu_cache.get(restaurant_id, cache_key)
+    if cached is not None:
+        menu_page, etag = cached
+        return conditional_response(request, response, etag) or PydanticJSONResponse(
+            Page[MenuItemUpdate], menu_page, headers=response.headers)
+
+    version = menu_cache.version(restaurant_id)
+    query = select(*schema_columns(MenuItem, MenuItemUpdate))\
+        .where(MenuItem.restaurant_id == restaurant_id)
+    result = await paginate(db, query, MenuItem, page)
+
+    # Cache schema objects rather than database Rows
+    menu_page = Page[MenuItemUpdate](
+        items=[MenuItemUpdate.model_validate(item)
+               for item in result["items"]],
+        next_cursor=result["next_cursor"]
+    )
+    etag = make_etag(menu_page.items, menu_page.next_cursor)
+    menu_cache.put(restaurant_id, cache_key, (menu_page, etag), version)
+    return conditional_response(request, response, etag) or PydanticJSONResponse(
+        Page[MenuItemUpdate], menu_page, headers=response.headers)
 
 
 @router.get("/{item_id}", response_model=MenuItemUpdate)
-async def get_menu_item(item_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_menu_item(
+    item_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """Retrieve a single menu item by UUID."""
     item = await db.get(MenuItem, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item
+    return conditional_response(request, response, make_etag([item])) or item
 
 
 @router.post("/", response_model=MenuItemCreate)
@@ -49,6 +92,7 @@ async def add_menu_item(item: MenuItemCreate, restaurant_id: UUID, db: AsyncSess
         # Add to database
         db.add(new_item)
         await db.commit()
+        menu_cache.invalidate(restaurant_id)
         await db.refresh(new_item)
 
         return new_item
@@ -58,6 +102,74 @@ async def add_menu_item(item: MenuItemCreate, restaurant_id: UUID, db: AsyncSess
             status_code=500, detail=f"Error adding menu item: {str(e)}")
 
 
+@router.post("/import", response_model=MenuImportResult)
+async def import_menu_items(
+    restaurant_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """Bulk create menu items from a streamed CSV or NDJSON request body.
+
+    Rows are validated with MenuItemCreate and inserted in batches of
+    multi-row INSERTs within one transaction. Invalid rows are skipped and
+    reported by line number; valid rows are committed together. A line
+    longer than MAX_LINE_LENGTH rejects the whole upload with 413.
+    """
+    content_type = request.headers.get(
+        "Content-Type", "").split(";")[0].strip().lower()
+    if content_type not in CSV_CONTENT_TYPES | NDJSON_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=415, detail="Upload text/csv or application/x-ndjson")
+
+    inserted = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    async def flush_batch():
+        nonlocal inserted
+        if batch:
+            await db.execute(insert(MenuItem), batch)
+            inserted += len(batch)
+            batch.clear()
+
+    try:
+        lines = iter_lines(request.stream())
+        async for line, record, error in iter_records(lines, content_type):
+            item = None
+            if error is None:
+                item, error = validate_record(record)
+            if error is not None:
+                failed += 1
+                if len(errors) < MAX_REPORTED_IMPORT_ERRORS:
+                    errors.append({"line": line, "error": error})
+                continue
+
+            batch.append({
+                "restaurant_id": restaurant_id,
+                "name": item.name,
+                "description": item.description,
+                "price": item.price,
+                "image_url": item.image_url,
+                "category": item.category
+            })
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await flush_batch()
+        await flush_batch()
+        await db.commit()
+    except LineTooLong as e:
+        await db.rollback()
+        raise HTTPException(status_code=413, detail=str(e))
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=500, detail=f"Error importing menu items: {str(e)}")
+
+    if inserted:
+        menu_cache.invalidate(restaurant_id)
+    return {"inserted": inserted, "failed": failed, "errors": errors}
+
+
 @router.put("/{item_id}", response_model=MenuItemUpdate)
 async def update_menu_item(
     restaurant_id: UUID,
@@ -70,10 +182,14 @@ async def update_menu_item(
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
+    previous_restaurant_id = item.restaurant_id
     for key, value in item_data.dict(exclude_unset=True).items():
         setattr(item, key, value)
 
     await db.commit()
+    menu_cache.invalidate(previous_restaurant_id)
+    if item.restaurant_id != previous_restaurant_id:
+        menu_cache.invalidate(item.restaurant_id)
     await db.refresh(item)
     return item
 
@@ -87,5 +203,6 @@ async def delete_menu_item(item_id: UUID, db: AsyncSession = Depends(get_db)):
 
     await db.delete(item)
     await db.commit()
+    menu_cache.invalidate(item.restaurant_id)
 
     return {"message": "Menu item deleted successfully"}
@@ -1,15 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from backend.database import get_db
+from backend.etag import conditional_response, make_etag
+from backend.export import ndjson_export
+from backend.events import (
+    ORDER_CREATED, ORDER_STATUS_CHANGED, order_event_key, publish_order_events, stream_order_events
+)
+from backend.order_status import ADVANCE, CANCEL, transition_query
+from backend.pagination import PageParams, paginate, schema_columns
+from backend.rollups import record_completed_orders
+from backend.responses import PydanticJSONResponse
 
+from backend.models.menu_items import MenuItem
 from backend.models.orders import Order
 from backend.models.order_items import OrderItem
 
-from backend.schemas.orders import OrderCreate, OrderCreateWithItems, OrderUpdate
-from backend.schemas.order_items import OrderItemCreate
+from backend.schemas.orders import (
+    OrderBulkStatusResult, OrderBulkStatusUpdate, OrderCreate, OrderCreateWithItems, OrderUpdate
+)
+from backend.schemas.order_items import OrderItemUpdate
+from backend.schemas.pagination import Page
 
 from backend.security import require_user_type
 
@@ -22,81 +36,222 @@ router = APIRouter(
 )
 
 
-@router.get("/orders", response_model=list[OrderCreate])
-async def get_orders(restaurant_id: UUID, db: AsyncSession = Depends(get_db)):
-    """Retrieve all orders for a restaurant."""
-    query = select(Order).where(Order.restaurant_id == restaurant_id)
-    results = await db.execute(query)
-    return results.unique().scalars().all()
+@router.get("/orders", response_model=Page[OrderCreate])
+async def get_orders(
+    restaurant_id: UUID,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """Retrieve a page of orders for a restaurant."""
+    query = select(*schema_columns(Order, OrderCreate))\
+        .where(Order.restaurant_id == restaurant_id)
+    result = await paginate(db, query, Order, page)
+    etag = make_etag(result["items"], result["next_cursor"])
+    return conditional_response(request, response, etag) or PydanticJSONResponse(
+        Page[OrderCreate], result, headers=response.headers)
 
 
-@router.get("/users/{user_id}/orders", response_model=list[OrderCreate])
+@router.get("/users/{user_id}/orders", response_model=Page[OrderCreate])
 async def get_orders(
     restaurant_id: UUID,
     user_id: UUID,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(
         require_user_type(["admin", "restaurant_worker", "customer"])
     )
 ):
-    """Retrieve all orders by restaurant by user."""
+    """Retrieve a page of orders by restaurant by user."""
     if current_user["user_type"] == "customer":
         user_id = current_user["user_id"]
 
-    query = select(Order).where(Order.restaurant_id ==
-                                restaurant_id).where(Order.user_id == user_id)
-    results = await db.execute(query)
-    return results.unique().scalars().all()
+    query = select(*schema_columns(Order, OrderCreate))\
+        .where(Order.restaurant_id == restaurant_id)\
+        .where(Order.user_id == user_id)
+    result = await paginate(db, query, Order, page)
+    etag = make_etag(result["items"], result["next_cursor"])
+    return conditional_response(request, response, etag) or PydanticJSONResponse(
+        Page[OrderCreate], result, headers=response.headers)
+
+
+@router.get("/orders/export")
+async def export_orders(
+    restaurant_id: UUID,
+    current_user: dict = Depends(
+        require_user_type(["admin", "restaurant_worker"])
+    )
+):
+    """Export all orders of a restaurant as NDJSON, streamed row by row."""
+    query = select(*schema_columns(Order, OrderCreate))\
+        .where(Order.restaurant_id == restaurant_id)\
+        .order_by(Order.created_at, Order.id)
+    return ndjson_export(query, OrderCreate, "orders.ndjson")
+
+
+@router.get("/orders/events")
+async def get_order_events(
+    restaurant_id: UUID,
+    current_user: dict = Depends(
+        require_user_type(["admin", "restaurant_worker"])
+    )
+):
+    """Stream order created and status changed events for a restaurant (SSE)."""
+    return StreamingResponse(
+        stream_order_events(order_event_key(restaurant_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+@router.get("/users/{user_id}/orders/events")
+async def get_user_order_events(
+    restaurant_id: UUID,
+    user_id: UUID,
+    current_user: dict = Depends(
+        require_user_type(["admin", "restaurant_worker", "customer"])
+    )
+):
+    """Stream order events for one user's orders at a restaurant (SSE)."""
+    if current_user["user_type"] == "customer":
+        user_id = current_user["user_id"]
+
+    return StreamingResponse(
+        stream_order_events(order_event_key(restaurant_id, user_id)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
 
 
 @router.get("/users/{user_id}/orders/{order_id}", response_model=OrderCreate)
-async def get_order(order_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_order(
+    order_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """Retrieve a single order by UUID."""
     order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    return order
+    return conditional_response(request, response, make_etag([order])) or order
 
 
-@router.get("/users/{user_id}/orders/{order_id}/items", response_model=list[OrderItemCreate])
-async def get_order(order_id: UUID, db: AsyncSession = Depends(get_db)):
+@router.get("/users/{user_id}/orders/{order_id}/items", response_model=list[OrderItemUpdate])
+async def get_order(
+    order_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """Retrieve order items for a given order."""
     query = select(OrderItem).where(OrderItem.order_id == order_id)
     results = await db.execute(query)
-    return results.unique().scalars().all()
+    order_items = results.scalars().all()
+    etag = make_etag(order_items)
+    return conditional_response(request, response, etag) or order_items
 
 
-@router.get("/status/{status}/orders", response_model=list[OrderCreate])
-async def get_orders_by_status(restaurant_id: UUID, status: str, db: AsyncSession = Depends(get_db)):
-    """Retrieve all orders of a specific status."""
-    query = select(Order)\
+@router.get("/status/{status}/orders", response_model=Page[OrderCreate])
+async def get_orders_by_status(
+    restaurant_id: UUID,
+    status: str,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """Retrieve a page of orders of a specific status."""
+    query = select(*schema_columns(Order, OrderCreate))\
         .where(Order.restaurant_id == restaurant_id)\
         .where(Order.status == status)
+    result = await paginate(db, query, Order, page)
+    etag = make_etag(result["items"], result["next_cursor"])
+    return conditional_response(request, response, etag) or PydanticJSONResponse(
+        Page[OrderCreate], result, headers=response.headers)
+
+
+@router.put("/orders/status", response_model=OrderBulkStatusResult)
+async def update_orders_status(
+    restaurant_id: UUID,
+    bulk_update: OrderBulkStatusUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(
+        require_user_type(["admin", "restaurant_worker"])
+    )
+):
+    """Advance or cancel many orders of a restaurant in a single statement.
+
+    Orders that do not exist, belong to another restaurant or cannot make
+    the transition from their current status are returned in `invalid_ids`.
+    """
+    query = transition_query(bulk_update.action)\
+        .where(Order.id.in_(set(bulk_update.order_ids)))\
+        .where(Order.restaurant_id == restaurant_id)
     results = await db.execute(query)
-    return results.scalars().all()
+    updated = results.mappings().all()
+    await publish_order_events(db, ORDER_STATUS_CHANGED, updated)
+    await record_completed_orders(db, updated)
+    await db.commit()
+
+    updated_ids = {row["id"] for row in updated}
+    return {
+        "updated": updated,
+        "invalid_ids": [order_id for order_id in bulk_update.order_ids
+                        if order_id not in updated_ids]
+    }
 
 
 @router.post("/users/{user_id}/orders", response_model=OrderCreateWithItems)
 async def create_order_with_items(restaurant_id: UUID, user_id: UUID, order_data: OrderCreateWithItems, db: AsyncSession = Depends(get_db)):
-    """Create an order along with its order items in a single transaction."""
+    """Create an order along with its order items in a single transaction.
+
+    Every line item must be an available menu item of the restaurant and is
+    charged at the menu price; any price sent by the client is ignored.
+    """
+    # All line items are resolved in one query, whatever the cart size
+    menu_item_ids = {item.menu_item_id for item in order_data.order_items}
+    results = await db.execute(
+        select(MenuItem.id, MenuItem.price)
+        .where(MenuItem.id.in_(menu_item_ids))
+        .where(MenuItem.restaurant_id == restaurant_id)
+        .where(MenuItem.available.is_not(False))
+    )
+    prices = dict(results.all())
+    invalid_ids = menu_item_ids - prices.keys()
+    if invalid_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Menu items not available: {', '.join(sorted(map(str, invalid_ids)))}")
+
+    # Items are attached through the relationship, so the response's nested
+    # order_items are already in memory and need no reload after the commit.
+    order_items = [
+        OrderItem(menu_item_id=item.menu_item_id, quantity=item.quantity,
+                  price=prices[item.menu_item_id])
+        for item in order_data.order_items
+    ]
     new_order = Order(
         user_id=user_id,
         restaurant_id=restaurant_id,
-        name=order_data.name
+        name=order_data.name,
+        order_items=order_items,
+        item_count=sum(item.quantity for item in order_items),
+        total_amount=sum(item.price * item.quantity for item in order_items)
     )
 
     db.add(new_order)
     await db.flush()
-
-    order_items = [
-        OrderItem(order_id=new_order.id, menu_item_id=item.menu_item_id,
-                  quantity=item.quantity, price=item.price)
-        for item in order_data.order_items
-    ]
-    db.add_all(order_items)
-
+    await publish_order_events(db, ORDER_CREATED, [{
+        "id": new_order.id,
+        "restaurant_id": new_order.restaurant_id,
+        "user_id": new_order.user_id,
+        "status": new_order.status
+    }])
     await db.commit()
-    await db.refresh(new_order)
 
     return new_order
 
@@ -107,51 +262,79 @@ async def update_order(
     order_data: OrderUpdate,
     db: AsyncSession = Depends(get_db)
 ):
-    """Update an existing order using UUID."""
+    """Update an existing order using UUID.
+
+    The status only moves through the next-status and cancel endpoints, which
+    check the current status in the UPDATE itself; a different status here
+    is rejected rather than written blindly.
+    """
     order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    for key, value in order_data.dict(exclude_unset=True).items():
+    updates = order_data.dict(
+        exclude_unset=True, exclude={"item_count", "total_amount"})
+    if updates.pop("status", order.status) != order.status:
+        raise HTTPException(
+            status_code=400,
+            detail="Use the next-status or cancel endpoints to change the status")
+    for key, value in updates.items():
         setattr(order, key, value)
     await db.commit()
     await db.refresh(order)
     return order
 
 
+async def rejected_transition(db: AsyncSession, order_id: UUID, expected_status: str):
+    """Builds the error for a transition whose UPDATE matched no row."""
+    await db.rollback()
+    current_status = await db.scalar(select(Order.status).where(Order.id == order_id))
+    if current_status is None:
+        return HTTPException(status_code=404, detail="Order not found")
+    if current_status != expected_status:
+        return HTTPException(
+            status_code=409, detail=f"Order status changed to '{current_status}'")
+    if current_status == "completed":
+        return HTTPException(status_code=400, detail="Order is already completed")
+    return HTTPException(
+        status_code=400, detail=f"Invalid status transition from '{current_status}'")
+
+
 @router.put("/users/{user_id}/orders/{order_id}/next-status", response_model=OrderUpdate)
-async def update_order_status(order_id: UUID, db: AsyncSession = Depends(get_db)):
+async def update_order_status(
+    order_id: UUID,
+    expected_status: str = Query(
+        ..., description="Reject with 409 unless the order is still in this status"),
+    db: AsyncSession = Depends(get_db)
+):
     """Move the order to the next status in the sequence."""
-    order = await db.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-
-    status_flow = ["pending", "preparing", "ready", "completed"]
+    query = transition_query(ADVANCE, expected_status).where(Order.id == order_id)
+    results = await db.execute(query)
+    order = results.mappings().first()
+    if order is None:
+        raise await rejected_transition(db, order_id, expected_status)
 
-    if order.status == "completed":
-        raise HTTPException(
-            status_code=400, detail="Order is already completed")
-
-    try:
-        next_status = status_flow[status_flow.index(order.status) + 1]
-        order.status = next_status
-        await db.commit()
-        await db.refresh(order)
-        return order
-    except IndexError:
-        raise HTTPException(
-            status_code=400, detail="Invalid status transition")
+    await publish_order_events(db, ORDER_STATUS_CHANGED, [order])
+    await record_completed_orders(db, [order])
+    await db.commit()
+    return order
 
 
 @router.put("/users/{user_id}/orders/{order_id}/cancel", response_model=OrderUpdate)
-async def cancel_order(order_id: UUID, db: AsyncSession = Depends(get_db)):
+async def cancel_order(
+    order_id: UUID,
+    expected_status: str = Query(
+        ..., description="Reject with 409 unless the order is still in this status"),
+    db: AsyncSession = Depends(get_db)
+):
     """Cancel the order by setting the status to 'cancelled'."""
-    order = await db.get(Order, order_id)
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
+    query = transition_query(CANCEL, expected_status).where(Order.id == order_id)
+    results = await db.execute(query)
+    order = results.mappings().first()
+    if order is None:
+        raise await rejected_transition(db, order_id, expected_status)
 
-    order.status = "cancelled"
+    await publish_order_events(db, ORDER_STATUS_CHANGED, [order])
     await db.commit()
-    await db.refresh(order)
     return order
 
 
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from backend.cache import menu_cache
 from backend.database import get_db
+from backend.etag import conditional_response, make_etag
+from backend.pagination import PageParams, paginate, schema_columns
+from backend.responses import PydanticJSONResponse
 from backend.models.restaurants import Restaurant
 from backend.schemas.restaurants import RestaurantCreate, RestaurantUpdate
+from backend.schemas.pagination import Page
 from uuid import UUID
 
 router = APIRouter(
@@ -12,21 +17,34 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=list[RestaurantUpdate])
-async def get_restaurants(db: AsyncSession = Depends(get_db)):
-    """Retrieve all restaurants."""
-    result = await db.execute(select(Restaurant))
-    restaurants = result.scalars().all()
-    return restaurants
+@router.get("/", response_model=Page[RestaurantUpdate])
+async def get_restaurants(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    """Retrieve a page of restaurants."""
+    query = select(*schema_columns(Restaurant, RestaurantUpdate))
+    result = await paginate(db, query, Restaurant, page)
+    etag = make_etag(result["items"], result["next_cursor"])
+    return conditional_response(request, response, etag) or PydanticJSONResponse(
+        Page[RestaurantUpdate], result, headers=response.headers)
 
 
 @router.get("/{restaurant_id}", response_model=RestaurantUpdate)
-async def get_restaurant(restaurant_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_restaurant(
+    restaurant_id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """Retrieve a single restaurant by UUID."""
     restaurant = await db.get(Restaurant, restaurant_id)
     if not restaurant:
         raise HTTPException(status_code=404, detail="Restaurant not found")
-    return restaurant
+    etag = make_etag([restaurant])
+    return conditional_response(request, response, etag) or restaurant
 
 
 @router.post("/", response_model=RestaurantCreate)
@@ -78,4 +96,6 @@ async def delete_restaurant(restaurant_id: UUID, db: AsyncSession = Depends(get_
 
     await db.delete(restaurant)
     await db.commit()
+    # Its menu items were deleted with it
+    menu_cache.invalidate(restaurant_id)
     return {"message": "Restaurant deleted successfully"}
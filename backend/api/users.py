@@ -5,27 +5,44 @@ from uuid import UUID
 
 from backend.logger import logger
 from backend.database import get_db
+from backend.export import ndjson_export
+from backend.pagination import PageParams, paginate, schema_columns
+from backend.responses import PydanticJSONResponse
 from backend.models.users import User
 from backend.schemas.users import UserCreate, UserUpdate, UserLogin, UserPasswordUpdate
+from backend.schemas.pagination import Page
 
-from backend.security import hash_password, pwd_context, verify_password, create_access_token, require_user_type
+from backend.security import hash_password, verify_password, create_access_token, require_user_type
 
 router = APIRouter(tags=["Users Endpoints"])
 
 
-@router.get("/users/", response_model=list[UserUpdate])
+@router.get("/users/", response_model=Page[UserUpdate])
 async def get_users(
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(
         require_user_type(["admin"])
     )
 ):
-    """Retrieve all users."""
+    """Retrieve a page of users."""
     logger.debug(
         f"Restricted for user type admin or restaurant worker: {current_user}")
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+    query = select(*schema_columns(User, UserUpdate))
+    result = await paginate(db, query, User, page)
+    return PydanticJSONResponse(Page[UserUpdate], result)
+
+
+@router.get("/users/export")
+async def export_users(
+    current_user: dict = Depends(
+        require_user_type(["admin"])
+    )
+):
+    """Export all users as NDJSON, streamed row by row."""
+    query = select(*schema_columns(User, UserUpdate))\
+        .order_by(User.created_at, User.id)
+    return ndjson_export(query, UserUpdate, "users.ndjson")
 
 
 @router.get("/users/current_user", response_model=UserUpdate)
@@ -64,26 +81,28 @@ async def get_user(
     return user
 
 
-@router.get("/users/type/{user_type}", response_model=list[UserUpdate])
+@router.get("/users/type/{user_type}", response_model=Page[UserUpdate])
 async def get_users_by_type(
     user_type: str,
+    page: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(
         require_user_type(["admin"])
     )
 ):
-    """Retrieve all users of a specific type."""
-    result = await db.execute(select(User).where(User.user_type == user_type))
-    users = result.scalars().all()
-    return users
+    """Retrieve a page of users of a specific type."""
+    query = select(*schema_columns(User, UserUpdate))\
+        .where(User.user_type == user_type)
+    result = await paginate(db, query, User, page)
+    return PydanticJSONResponse(Page[UserUpdate], result)
 
 
 @router.post("/register/", response_model=UserUpdate)
 async def add_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
-    try:
-        # Hash the user's password before storing it
-        hashed_password = hash_password(user.password)
+    # Hash the user's password before storing it
+    hashed_password = await hash_password(user.password)
 
+    try:
         # Create a new user
         new_user = User(
             name=user.name,
@@ -115,7 +134,7 @@ async def login(user: UserLogin, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == user.email))
     user_db = result.scalars().first()
 
-    if not user_db or not verify_password(user.password, user_db.password):
+    if not user_db or not await verify_password(user.password, user_db.password):
         raise HTTPException(
             status_code=401, detail="Invalid email or password")
 
@@ -151,11 +170,11 @@ async def update_password(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if not pwd_context.verify(password_data.old_password, user.password):
+    if not await verify_password(password_data.old_password, user.password):
         raise HTTPException(status_code=401, detail="Incorrect old password")
 
     # Hash the new password and update it
-    user.password = hash_password(password_data.new_password)
+    user.password = await hash_password(password_data.new_password)
 
     await db.commit()
     return {"message": "Password updated successfully"}
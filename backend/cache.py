@@ -0,0 +1,110 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from uuid import UUID
+
+from backend.config import settings
+
+
+class MenuCache:
+    """In-process LRU cache of menu pages, keyed by restaurant.
+
+    Every restaurant has a version number that is bumped on each menu write.
+    A reader takes the version before querying the database and only stores
+    its result if the version is unchanged, so a page read concurrently with
+    a write is never cached.
+
+    The cache is per process and a write only invalidates the copy of the
+    worker that handled it. Entries therefore expire `ttl` seconds after they
+    were stored, which bounds how long other workers serve the old menu (and
+    answer 304 to its ETag). A ttl of 0 keeps entries until evicted, which is
+    only correct with a single worker.
+    """
+
+    def __init__(self, max_entries: int, ttl: float = 0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # full key -> (value, monotonic expiry time or None)
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self._keys_by_restaurant: dict[UUID, set[tuple]] = {}
+        self._versions: dict[UUID, int] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def version(self, restaurant_id: UUID) -> int:
+        """Current menu version of a restaurant."""
+        return self._versions.get(restaurant_id, 0)
+
+    def get(self, restaurant_id: UUID, key: tuple):
+        """Returns the cached value or None, updating the hit/miss counters."""
+        full_key = (restaurant_id, *key)
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None and entry[1] is not None \
+                    and entry[1] <= time.monotonic():
+                del self._entries[full_key]
+                self._discard_key(full_key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, restaurant_id: UUID, key: tuple, value, version: int) -> None:
+        """Stores a value read at `version`, unless the menu changed since."""
+        if self.max_entries <= 0:
+            return
+        full_key = (restaurant_id, *key)
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else None
+        with self._lock:
+            if self._versions.get(restaurant_id, 0) != version:
+                return
+            self._entries[full_key] = (value, expires_at)
+            self._entries.move_to_end(full_key)
+            self._keys_by_restaurant.setdefault(
+                restaurant_id, set()).add(full_key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._discard_key(old_key)
+                self.evictions += 1
+
+    def invalidate(self, restaurant_id: UUID) -> None:
+        """Bumps the restaurant's menu version and drops its cached pages."""
+        with self._lock:
+            self._versions[restaurant_id] = self._versions.get(
+                restaurant_id, 0) + 1
+            for full_key in self._keys_by_restaurant.pop(restaurant_id, ()):
+                self._entries.pop(full_key, None)
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        """Counters for monitoring how much database load the cache saves."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "ttl_seconds": self.ttl,
+            "invalidations": self.invalidations,
+        }
+
+    def _discard_key(self, full_key: tuple) -> None:
+        keys = self._keys_by_restaurant.get(full_key[0])
+        if keys is not None:
+            keys.discard(full_key)
+            if not keys:
+                del self._keys_by_restaurant[full_key[0]]
+
+
+menu_cache = MenuCache(settings.MENU_CACHE_SIZE, settings.MENU_CACHE_TTL_SECONDS)
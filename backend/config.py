@@ -6,6 +6,34 @@ class Settings(BaseSettings):
     DATABASE_URL: str 
     SECRET_KEY: str
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text", or "json" for one JSON object per line
+    LOG_QUEUE: bool = False  # Write log records from a background thread
+    LOG_REQUESTS: bool = False  # One log record per request with route, status and latency
+    LOG_SAMPLE_RATES: dict[str, float] = {}  # Share of records kept per level, e.g. {"INFO": 0.1}
+
+    # Database engine profile
+    DB_ECHO: bool = False  # Log every SQL statement
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True  # Check connections on checkout (Neon drops idle ones)
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # Server-side statement timeout, 0 disables
+    DB_MAX_CONNECTIONS: int = 0  # Split across workers by backend.serve, 0 keeps the per-worker pool settings
+
+    MENU_CACHE_SIZE: int = 1024  # Cached menu pages per process, 0 disables
+    MENU_CACHE_TTL_SECONDS: float = 30  # How stale other workers' menu pages can get, 0 never expires them
+    PASSWORD_HASH_WORKERS: int = 4  # Threads running bcrypt
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # Waiting hash calls before answering 503
+    TOKEN_CACHE_SIZE: int = 4096  # Verified JWTs kept per process, 0 disables
+    METRICS_TOKEN: str = ""  # Bearer token Prometheus scrapes /metrics with, empty allows admins only
+
+    # Server started by `python -m backend.serve`
+    WEB_HOST: str = "0.0.0.0"
+    WEB_PORT: int = 8000
+    WEB_WORKERS: int = 0  # Worker processes, 0 uses one per available CPU
+    WEB_KEEP_ALIVE_SECONDS: int = 5
+    WEB_GRACEFUL_SHUTDOWN_SECONDS: int = 30  # Time in-flight requests get to finish on SIGTERM
 
     class Config:
         env_file = ".env" 
@@ -1,8 +1,97 @@
+import time
+from threading import Lock
+
+import asyncpg
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from backend.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+
+class PoolStats:
+    """Connection pool counters: checkout waits and connection churn."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.checkout_wait_seconds_total = 0.0
+        self.checkout_wait_seconds_max = 0.0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.connections_invalidated = 0
+
+    def record_checkout(self, wait: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_seconds_total += wait
+            self.checkout_wait_seconds_max = max(
+                self.checkout_wait_seconds_max, wait)
+
+    def stats(self, pool) -> dict:
+        with self._lock:
+            checkouts = self.checkouts
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "checkouts": checkouts,
+                "checkout_wait_seconds_avg": self.checkout_wait_seconds_total / checkouts if checkouts else 0.0,
+                "checkout_wait_seconds_max": self.checkout_wait_seconds_max,
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "connections_invalidated": self.connections_invalidated,
+            }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_stats.record_checkout(time.perf_counter() - started)
+
+
+connect_args = {}
+if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    connect_args["server_settings"] = {
+        "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=InstrumentedPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=connect_args
+)
+
+
+@event.listens_for(engine.sync_engine.pool, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_stats.connections_opened += 1
+
+
+@event.listens_for(engine.sync_engine.pool, "close")
+def _on_close(dbapi_connection, connection_record):
+    pool_stats.connections_closed += 1
+
+
+@event.listens_for(engine.sync_engine.pool, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    pool_stats.connections_invalidated += 1
+
 
 async_session_factory = sessionmaker(
     bind=engine,
@@ -14,3 +103,18 @@ async_session_factory = sessionmaker(
 async def get_db():
     async with async_session_factory() as session:
         yield session
+
+
+async def connect_asyncpg() -> asyncpg.Connection:
+    """Opens a plain asyncpg connection, outside the pool, to DATABASE_URL.
+
+    Used for LISTEN and COPY. The arguments are derived by the engine's
+    dialect, so query options of the SQLAlchemy URL such as `?ssl=require`
+    are passed to asyncpg as keyword arguments instead of being
+    misread as server settings by asyncpg's own DSN parser.
+    """
+    _, kwargs = engine.dialect.create_connect_args(engine.url)
+    # Options of SQLAlchemy's asyncpg adapter, not of asyncpg.connect()
+    kwargs.pop("prepared_statement_cache_size", None)
+    kwargs.pop("prepared_statement_name_func", None)
+    return await asyncpg.connect(**kwargs)
@@ -0,0 +1,51 @@
+import hashlib
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.engine import Row
+
+
+def _row_values(row) -> tuple:
+    """Column values of an ORM instance, Row or schema object, in a stable order."""
+    if isinstance(row, Row):
+        return tuple(row)
+    if isinstance(row, BaseModel):
+        return tuple(row.model_dump().values())
+    mapper = inspect(row).mapper
+    return tuple(getattr(row, attr.key) for attr in mapper.column_attrs)
+
+
+def make_etag(rows, *extra) -> str:
+    """Builds a strong ETag from the content of `rows` plus any extra values.
+
+    Hashing the column values is much cheaper than serializing the response,
+    so a matching request can be answered without building the body.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for row in rows:
+        digest.update(repr(_row_values(row)).encode())
+    for value in extra:
+        digest.update(repr(value).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header matches `etag`."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Response | None:
+    """Sets the ETag header and returns a 304 response if the client is current.
+
+    Handlers return the 304 response as is when it is not None, and their
+    regular body otherwise.
+    """
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
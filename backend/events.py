@@ -0,0 +1,125 @@
+import asyncio
+import json
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.database import connect_asyncpg
+from backend.logger import logger
+
+ORDER_EVENTS_CHANNEL = "order_events"
+ORDER_CREATED = "order_created"
+ORDER_STATUS_CHANGED = "order_status_changed"
+
+SUBSCRIBER_QUEUE_SIZE = 100
+HEARTBEAT_SECONDS = 15
+
+
+async def publish_order_events(db: AsyncSession, event: str, orders) -> None:
+    """Queues a NOTIFY per order in the current transaction.
+
+    Postgres delivers the notifications only when the transaction commits,
+    so listeners never see an order that was rolled back. All notifications
+    are sent in one statement regardless of how many orders changed.
+    """
+    payloads = [
+        json.dumps({
+            "event": event,
+            "order_id": str(order["id"]),
+            "restaurant_id": str(order["restaurant_id"]),
+            "user_id": str(order["user_id"]) if order["user_id"] else None,
+            "status": order["status"],
+        })
+        for order in orders
+    ]
+    if payloads:
+        await db.execute(
+            text("SELECT pg_notify(:channel, payload) "
+                 "FROM unnest(CAST(:payloads AS text[])) AS payload"),
+            {"channel": ORDER_EVENTS_CHANNEL, "payloads": payloads}
+        )
+
+
+class OrderEventBroker:
+    """Fans order notifications from one LISTEN connection out to subscribers.
+
+    Each worker process holds a single dedicated asyncpg connection, opened
+    on the first subscription, so connected screens cause no database load.
+    LISTEN needs a session-level connection: point DATABASE_URL at a direct
+    (not transaction-pooled) endpoint.
+    """
+
+    def __init__(self):
+        self._connection: asyncpg.Connection | None = None
+        self._lock = asyncio.Lock()
+        self._subscribers: dict[tuple, set[asyncio.Queue]] = {}
+
+    async def ensure_listening(self) -> None:
+        """Opens the LISTEN connection, or reopens it after it was lost."""
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            self._connection = await connect_asyncpg()
+            self._connection.add_termination_listener(self._on_terminated)
+            await self._connection.add_listener(
+                ORDER_EVENTS_CHANNEL, self._on_notify)
+            logger.info("Listening for order events")
+
+    async def subscribe(self, key: tuple) -> asyncio.Queue:
+        """Registers a subscriber for ("restaurant", id) or ("user", id, id)."""
+        await self.ensure_listening()
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(key, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, key: tuple, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(key)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[key]
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        event = json.loads(payload)
+        keys = [("restaurant", event["restaurant_id"])]
+        if event["user_id"]:
+            keys.append(("user", event["restaurant_id"], event["user_id"]))
+        for key in keys:
+            for queue in self._subscribers.get(key, ()):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # A client this far behind will resync by polling
+                    logger.warning(f"Dropping order event for slow subscriber {key}")
+
+    def _on_terminated(self, connection) -> None:
+        logger.warning("Order event connection closed")
+        self._connection = None
+
+
+order_events = OrderEventBroker()
+
+
+def order_event_key(restaurant_id: UUID, user_id: UUID | None = None) -> tuple:
+    if user_id is None:
+        return ("restaurant", str(restaurant_id))
+    return ("user", str(restaurant_id), str(user_id))
+
+
+async def stream_order_events(key: tuple):
+    """Server-sent events for one subscriber, with periodic keep-alives."""
+    queue = await order_events.subscribe(key)
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                await order_events.ensure_listening()
+                continue
+            yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+    finally:
+        order_events.unsubscribe(key, queue)
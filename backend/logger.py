@@ -1,10 +1,180 @@
+import atexit
+import copy
+import json
 import logging
+import queue
+import random
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
 from backend.config import settings
 
-logging.basicConfig(
-    format="%(levelname)s:     %(asctime)s  - MESSAGE: %(message)s",
-    level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
-)
+TEXT_FORMAT = "%(levelname)s:     %(asctime)s  - MESSAGE: %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class RequestContext:
+    """The request a log record was emitted from."""
+    __slots__ = ("request_id", "scope", "started")
+
+    def __init__(self, request_id: str, scope: dict):
+        self.request_id = request_id
+        self.scope = scope
+        self.started = time.perf_counter()
+
+
+# Set by RequestLogMiddleware for the duration of each request
+request_context: ContextVar[RequestContext | None] = ContextVar(
+    "request_context", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """Adds request id, route, user type and elapsed time to each record.
+
+    Runs in the thread that logs, before the record is queued, because the
+    request context is not visible from the listener thread.
+    """
+
+    def filter(self, record):
+        context = request_context.get()
+        if context is not None:
+            scope = context.scope
+            route = scope.get("route")
+            user = scope.get("state", {}).get("user") or {}
+            record.request_id = context.request_id
+            record.route = route.path if route is not None else scope["path"]
+            record.user_type = user.get("user_type")
+            record.latency_ms = round((time.perf_counter() - context.started) * 1000, 3)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a configured share of the records of each level.
+
+    Levels without a rate are always kept.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = {logging.getLevelName(level.upper()): rate
+                      for level, rate in rates.items()}
+
+    def filter(self, record):
+        rate = self.rates.get(record.levelno)
+        return rate is None or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class LocalQueueHandler(QueueHandler):
+    """Queues records for a listener thread in the same process.
+
+    Unlike QueueHandler, it leaves formatting to the listener's handler: only
+    the message arguments and the traceback are rendered up front, while they
+    are still current.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging() -> None:
+    handler = logging.StreamHandler()
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    if settings.LOG_QUEUE:
+        # The event loop only enqueues; formatting and I/O happen in the
+        # listener thread, which flushes what is left on exit.
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        handler = LocalQueueHandler(log_queue)
+
+    # Sampled out records are dropped before they are queued or formatted
+    handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATES))
+    handler.addFilter(RequestContextFilter())
+
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
+        handlers=[handler],
+    )
+
+
+configure_logging()
 
 logger = logging.getLogger("FastAPI")
- 
\ No newline at end of file
+
+
+class RequestLogMiddleware:
+    """ASGI middleware giving each request an id for its log records.
+
+    The id is taken from an incoming X-Request-ID header or generated, and
+    returned in the response. With LOG_REQUESTS, one record per request is
+    logged with its method, path, status and latency.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = request_context.set(RequestContext(request_id, scope))
+        status_code = 500
+
+        async def send_with_request_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            if settings.LOG_REQUESTS:
+                logger.info("Request handled", extra={
+                    "method": scope["method"], "path": scope["path"],
+                    "status": status_code})
+            request_context.reset(token)
@@ -1,42 +1,43 @@
-from fastapi import FastAPI, Request, HTTPException, Response
+from fastapi import FastAPI
 from fastapi.security import APIKeyHeader
 
-from backend.security import get_current_user
+from backend.security import AuthMiddleware
 
-from backend.logger import logger
+from backend.logger import RequestLogMiddleware
+from backend.metrics import MetricsMiddleware, router as metrics_router
 
 from backend.api.menu import router as menu_router
 from backend.api.users import router as user_router
 from backend.api.orders import router as order_router
 from backend.api.restaurant import router as restaurant_router
+from backend.api.admin import router as admin_router
+from backend.api.analytics import router as analytics_router
 
 tags_metadata = [
     {"name": "Menu Items Endpoints", "description": "All about menu items"},
     {"name": "Orders Endpoints", "description": "All about orders and order items"},
     {"name": "Users Endpoints", "description": "All about users"},
     {"name": "Restaurant Endpoints", "description": "All about restaurants"},
+    {"name": "Analytics Endpoints", "description": "Sales and top menu items per restaurant"},
+    {"name": "Admin Endpoints", "description": "Runtime statistics for operators"},
 ]
 
 app = FastAPI(openapi_tags=tags_metadata)
 
 api_key_header = APIKeyHeader(name="Authorization", auto_error=False)
 
-
-@app.middleware("http")
-async def api_auth_middleware(request: Request, call_next):
-    """Middleware to protect all API endpoints except login/docs."""
-    if request.url.path.startswith("/docs") or request.url.path.startswith("/openapi.json") or request.url.path.startswith("/login") or request.url.path.startswith("/register"):
-        logger.info("Unprotected path")
-        return await call_next(request)
-    try:
-        logger.info("Protected path. Fetching user data")
-        payload = get_current_user(request)
-    except HTTPException:
-        logger.info("Unauthorized")
-        return Response(content={"detail": "Unauthorized access"}, status_code=401)
-    return await call_next(request)
+# Protects every endpoint except login, registration, docs and metrics, which
+# checks its own scrape token
+app.add_middleware(AuthMiddleware)
+# Added last so it wraps the auth middleware and also counts rejected requests
+app.add_middleware(MetricsMiddleware)
+# Outermost, so every log record of a request carries its id
+app.add_middleware(RequestLogMiddleware)
 
 app.include_router(menu_router)
 app.include_router(user_router)
 app.include_router(order_router)
 app.include_router(restaurant_router)
+app.include_router(analytics_router)
+app.include_router(admin_router)
+app.include_router(metrics_router)
@@ -0,0 +1,87 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+
+from backend.schemas.menu_items import MenuItemCreate
+
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson",
+                        "application/jsonl"}
+MAX_LINE_LENGTH = 64 * 1024  # Characters, so a body without line breaks is not buffered whole
+
+
+class LineTooLong(ValueError):
+    """A line of the body is longer than the allowed maximum."""
+
+
+async def iter_lines(chunks: AsyncIterator[bytes],
+                     max_length: int = MAX_LINE_LENGTH) -> AsyncIterator[str]:
+    """Splits a streamed UTF-8 body into lines without buffering the whole body.
+
+    Raises LineTooLong as soon as a line, complete or not, exceeds `max_length`.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_number = 0
+
+    def checked(line: str, number: int) -> str:
+        line = line.rstrip("\r")
+        if len(line) > max_length:
+            raise LineTooLong(f"line {number} is longer than {max_length} characters")
+        return line
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            yield checked(line, line_number)
+        checked(buffer, line_number + 1)
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield checked(buffer, line_number + 1)
+
+
+async def iter_records(lines: AsyncIterator[str], content_type: str):
+    """Yields (line_number, record, error) for each non-empty line.
+
+    CSV input must start with a header row naming the MenuItemCreate fields.
+    Quoted CSV fields cannot contain line breaks.
+    """
+    header = None
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            if content_type in NDJSON_CONTENT_TYPES:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+            else:
+                values = next(csv.reader([line]))
+                if header is None:
+                    header = [name.strip() for name in values]
+                    continue
+                if len(values) != len(header):
+                    raise ValueError(
+                        f"expected {len(header)} columns, got {len(values)}")
+                record = dict(zip(header, values))
+        except (ValueError, csv.Error) as e:
+            yield line_number, None, str(e)
+            continue
+        yield line_number, record, None
+
+
+def validate_record(record: dict) -> tuple[MenuItemCreate | None, str | None]:
+    """Validates one record against MenuItemCreate, returning a readable error."""
+    try:
+        return MenuItemCreate.model_validate(record), None
+    except ValidationError as e:
+        return None, "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors())
@@ -0,0 +1,170 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event
+
+from backend.database import engine
+from backend.security import require_metrics_access
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestDbStats:
+    """SQL statements and database time accumulated by one request."""
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+# Set by MetricsMiddleware for the duration of each request. SQLAlchemy runs
+# engine events in a greenlet that inherits this context, so the listeners
+# below can attribute each statement to the request that issued it.
+request_db_stats: ContextVar[RequestDbStats | None] = ContextVar(
+    "request_db_stats", default=None)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += time.perf_counter() - context._metrics_started
+
+
+class MetricsRegistry:
+    """Per-process request metrics, rendered in the Prometheus text format.
+
+    All updates happen on the event loop thread, so plain dicts are enough.
+    With several workers, each process exposes its own series.
+    """
+
+    def __init__(self):
+        self.requests: dict[tuple, int] = {}
+        self.latency: dict[tuple, list] = {}
+        self.db_statements: dict[tuple, int] = {}
+        self.db_seconds: dict[tuple, float] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float, db: RequestDbStats) -> None:
+        key = (method, route)
+        status_key = (method, route, str(status))
+        self.requests[status_key] = self.requests.get(status_key, 0) + 1
+
+        histogram = self.latency.get(key)
+        if histogram is None:
+            # One counter per bucket plus +Inf, then the running sum
+            histogram = self.latency[key] = [0] * (len(LATENCY_BUCKETS) + 1) + [0.0]
+        histogram[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        histogram[-1] += seconds
+
+        self.db_statements[key] = self.db_statements.get(key, 0) + db.statements
+        self.db_seconds[key] = self.db_seconds.get(key, 0.0) + db.seconds
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_requests_total Requests by route and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, status), count in self.requests.items():
+            lines.append(
+                f"http_requests_total{_labels(method, route, status=status)} {count}")
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in self.latency.items():
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), histogram):
+                cumulative += count
+                lines.append(
+                    f"http_request_duration_seconds_bucket{_labels(method, route, le=bound)} {cumulative}")
+            lines.append(
+                f"http_request_duration_seconds_sum{_labels(method, route)} {histogram[-1]}")
+            lines.append(
+                f"http_request_duration_seconds_count{_labels(method, route)} {cumulative}")
+
+        lines += [
+            "# HELP db_statements_total SQL statements issued, by route.",
+            "# TYPE db_statements_total counter",
+        ]
+        for (method, route), count in self.db_statements.items():
+            lines.append(f"db_statements_total{_labels(method, route)} {count}")
+
+        lines += [
+            "# HELP db_time_seconds_total Time spent executing SQL, by route.",
+            "# TYPE db_time_seconds_total counter",
+        ]
+        for (method, route), seconds in self.db_seconds.items():
+            lines.append(f"db_time_seconds_total{_labels(method, route)} {seconds}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(method: str, route: str, **extra) -> str:
+    labels = {"method": method, "route": route, **extra}
+    return "{" + ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording status, latency and DB usage per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        db_stats = RequestDbStats()
+        token = request_db_stats.set(db_stats)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Route templates keep the label set bounded; unmatched paths share one
+            route = scope.get("route")
+            metrics.observe(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status_code,
+                time.perf_counter() - started,
+                db_stats
+            )
+            request_db_stats.reset(token)
+
+
+router = APIRouter(tags=["Admin Endpoints"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False,
+            dependencies=[Depends(require_metrics_access)])
+async def get_metrics():
+    """Expose request and database metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4")
@@ -3,3 +3,5 @@ from backend.models.restaurants import Restaurant
 from backend.models.order_items import OrderItem
 from backend.models.orders import Order
 from backend.models.users import User
+from backend.models.sales_rollups import SalesRollup
+from backend.models.order_rollups import OrderRollup
@@ -1,2 +1,9 @@
+from datetime import datetime, timezone
+
 from sqlalchemy.ext.declarative import declarative_base
 Base = declarative_base()
+
+
+def utcnow() -> datetime:
+    """Current time in UTC without tzinfo, as every TIMESTAMP column stores it."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -1,15 +1,17 @@
-from sqlalchemy import Column, String, TIMESTAMP, DECIMAL, Boolean, Enum, ForeignKey
+from sqlalchemy import Column, String, TIMESTAMP, DECIMAL, Boolean, Enum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from backend.models.base import Base
-
-from datetime import datetime
+from backend.models.base import Base, utcnow
 
 import uuid
 
 
 class MenuItem(Base):
     __tablename__ = "menu_items"
+    __table_args__ = (
+        Index("ix_menu_items_restaurant_id_created_at",
+              "restaurant_id", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     restaurant_id = Column(UUID(as_uuid=True), ForeignKey(
@@ -21,7 +23,10 @@ class MenuItem(Base):
     image_url = Column(String)
     category = Column(String, nullable=False)
     available = Column(Boolean, default=True)
-    created_at = Column(TIMESTAMP, default=datetime.now())
+    created_at = Column(TIMESTAMP, default=utcnow)
 
-    order_items = relationship("OrderItem", back_populates="menu_items")
+    # order_items.menu_item_id is ON DELETE SET NULL, so deletes need not
+    # load order items
+    order_items = relationship(
+        "OrderItem", back_populates="menu_items", passive_deletes=True)
     restaurant = relationship("Restaurant", back_populates="menu_items")
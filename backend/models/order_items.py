@@ -1,9 +1,7 @@
 from sqlalchemy import Column, String, TIMESTAMP, DECIMAL, ForeignKey, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from backend.models.base import Base
-
-from datetime import datetime
+from backend.models.base import Base, utcnow
 
 import uuid
 
@@ -13,13 +11,13 @@ class OrderItem(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     order_id = Column(UUID(as_uuid=True), ForeignKey(
-        "orders.id", ondelete="CASCADE"))
+        "orders.id", ondelete="CASCADE"), index=True)
+    # Deleting a menu item keeps past order lines, which carry their own price
     menu_item_id = Column(UUID(as_uuid=True), ForeignKey(
-        "menu_items.id", ondelete="CASCADE"))
+        "menu_items.id", ondelete="SET NULL"))
     quantity = Column(Integer, nullable=False)
     price = Column(DECIMAL(10, 2), nullable=False)
-    created_at = Column(TIMESTAMP, default=datetime.now())
+    created_at = Column(TIMESTAMP, default=utcnow)
 
-    order = relationship("Order", back_populates="order_items", lazy="joined")
-    menu_items = relationship(
-        "MenuItem", back_populates="order_items", lazy="joined")
+    order = relationship("Order", back_populates="order_items")
+    menu_items = relationship("MenuItem", back_populates="order_items")
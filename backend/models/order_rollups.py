@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, TIMESTAMP, DECIMAL, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from backend.models.base import Base
+
+
+class OrderRollup(Base):
+    """Completed orders and revenue per restaurant and time bucket.
+
+    Kept apart from SalesRollup because an order with several menu items
+    would otherwise be counted once per item. Maintained by backend.rollups.
+    """
+    __tablename__ = "order_rollups"
+
+    restaurant_id = Column(UUID(as_uuid=True), ForeignKey(
+        "restaurants.id", ondelete="CASCADE"), primary_key=True)
+    granularity = Column(String, primary_key=True)  # "hour" or "day"
+    bucket_start = Column(TIMESTAMP, primary_key=True)
+
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(DECIMAL(12, 2), nullable=False, default=0)
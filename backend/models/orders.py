@@ -1,15 +1,21 @@
-from sqlalchemy import Column, String, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, String, TIMESTAMP, DECIMAL, ForeignKey, Index, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from backend.models.base import Base
-
-from datetime import datetime
+from backend.models.base import Base, utcnow
 
 import uuid
 
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_restaurant_id_created_at",
+              "restaurant_id", "created_at"),
+        Index("ix_orders_restaurant_id_status_created_at",
+              "restaurant_id", "status", "created_at"),
+        Index("ix_orders_restaurant_id_user_id_created_at",
+              "restaurant_id", "user_id", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     restaurant_id = Column(UUID(as_uuid=True), ForeignKey(
@@ -19,10 +25,14 @@ class Order(Base):
 
     name = Column(String, nullable=True)
     status = Column(String, default="pending")
-    created_at = Column(TIMESTAMP, default=datetime.now())
+    # Totals of the order's items, written with them so lists need no join
+    item_count = Column(Integer, nullable=False, default=0)  # Sum of quantities
+    total_amount = Column(DECIMAL(10, 2), nullable=False, default=0)
+    created_at = Column(TIMESTAMP, default=utcnow)
 
-    user = relationship("User", back_populates="orders", lazy="joined")
+    # Lazy by default; routes that return related rows load them explicitly
+    user = relationship("User", back_populates="orders")
     order_items = relationship(
-        "OrderItem", back_populates="order", lazy="joined", cascade="all, delete-orphan")
-    restaurant = relationship(
-        "Restaurant", back_populates="orders", lazy="joined")
+        "OrderItem", back_populates="order", cascade="all, delete-orphan",
+        passive_deletes=True)
+    restaurant = relationship("Restaurant", back_populates="orders")
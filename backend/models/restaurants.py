@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, UUID
+from sqlalchemy import Column, String, TIMESTAMP, UUID
 from sqlalchemy.orm import relationship
-from backend.models.base import Base
+from backend.models.base import Base, utcnow
+
 import uuid
 
 
@@ -16,11 +17,16 @@ class Restaurant(Base):
     state = Column(String, nullable=False)
     zip_code = Column(String, nullable=False)
     description = Column(String)
+    created_at = Column(TIMESTAMP, default=utcnow, index=True)
 
-    # Relationships
+    # Relationships, deleted by the ON DELETE CASCADE foreign keys rather
+    # than loaded (which an AsyncSession cannot do implicitly)
     menu_items = relationship(
-        "MenuItem", back_populates="restaurant", cascade="all, delete")
+        "MenuItem", back_populates="restaurant", cascade="all, delete",
+        passive_deletes=True)
     orders = relationship(
-        "Order", back_populates="restaurant", cascade="all, delete")
+        "Order", back_populates="restaurant", cascade="all, delete",
+        passive_deletes=True)
     users = relationship(
-        "User", back_populates="restaurant", cascade="all, delete")
+        "User", back_populates="restaurant", cascade="all, delete",
+        passive_deletes=True)
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, TIMESTAMP, DECIMAL, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from backend.models.base import Base
+
+
+class SalesRollup(Base):
+    """Quantity and revenue of one menu item per restaurant and time bucket.
+
+    Maintained by backend.rollups as orders are completed. menu_item_id has
+    no foreign key, so a deleted item's sales stay in the history. Lines
+    without a menu item (deleted before the order was completed, or before
+    a rebuild) cannot be attributed and are left out, while order_rollups
+    counts them in the order's total; the two revenues then differ by those
+    lines.
+    """
+    __tablename__ = "sales_rollups"
+
+    restaurant_id = Column(UUID(as_uuid=True), ForeignKey(
+        "restaurants.id", ondelete="CASCADE"), primary_key=True)
+    granularity = Column(String, primary_key=True)  # "hour" or "day"
+    bucket_start = Column(TIMESTAMP, primary_key=True)
+    menu_item_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue = Column(DECIMAL(12, 2), nullable=False, default=0)
+    order_count = Column(Integer, nullable=False, default=0)
@@ -1,14 +1,17 @@
-from sqlalchemy import Column, String, Boolean, TIMESTAMP, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, TIMESTAMP, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from backend.models.base import Base
+from backend.models.base import Base, utcnow
 
-from datetime import datetime
 import uuid
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_user_type_created_at", "user_type", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     restaurant_id = Column(UUID(as_uuid=True), ForeignKey(
@@ -19,7 +22,7 @@ class User(Base):
     password = Column(String, nullable=False)  # Hashed password
     user_type = Column(String, nullable=False)
     active = Column(Boolean, default=True)  # Soft delete
-    created_at = Column(TIMESTAMP, default=datetime.now())
+    created_at = Column(TIMESTAMP, default=utcnow)
 
     # Address fields
     address = Column(String, nullable=True)
@@ -27,5 +30,6 @@ class User(Base):
     state = Column(String, nullable=True)
     zip_code = Column(String, nullable=True)
 
-    orders = relationship("Order", back_populates="user")
+    # orders.user_id is ON DELETE SET NULL, so deletes need not load orders
+    orders = relationship("Order", back_populates="user", passive_deletes=True)
     restaurant = relationship("Restaurant", back_populates="users")
@@ -0,0 +1,48 @@
+from sqlalchemy import case, update
+
+from backend.models.orders import Order
+
+# Order lifecycle: pending -> preparing -> ready -> completed, and any order
+# that is not finished yet can be cancelled.
+STATUS_FLOW = ["pending", "preparing", "ready", "completed"]
+CANCELLED = "cancelled"
+
+NEXT_STATUS = dict(zip(STATUS_FLOW, STATUS_FLOW[1:]))
+CANCELLABLE_STATUSES = STATUS_FLOW[:-1]
+
+ADVANCE = "advance"
+CANCEL = "cancel"
+
+
+def transition(action: str):
+    """Returns (new status value or SQL expression, statuses allowed to move).
+
+    The new status is expressed in SQL so that an UPDATE can compute and
+    apply it atomically against the row's current status.
+    """
+    if action == ADVANCE:
+        return case(NEXT_STATUS, value=Order.status), list(NEXT_STATUS)
+    if action == CANCEL:
+        return CANCELLED, CANCELLABLE_STATUSES
+    raise ValueError(f"Unknown order action: {action}")
+
+
+def transition_query(action: str, expected_status: str | None = None):
+    """Builds an UPDATE applying `action` to the orders matched by `.where()`.
+
+    The new status is computed from each row's current status inside the
+    statement, so concurrent transitions cannot skip or lose a step. Passing
+    `expected_status` additionally rejects the change if another request moved
+    the order since the caller last saw it. Updated rows are returned with
+    the OrderUpdate columns.
+    """
+    new_status, allowed_statuses = transition(action)
+    query = update(Order)\
+        .where(Order.status.in_(allowed_statuses))\
+        .values(status=new_status)\
+        .returning(Order.id, Order.restaurant_id, Order.user_id, Order.status, Order.name,
+                   Order.item_count, Order.total_amount)\
+        .execution_options(synchronize_session=False)
+    if expected_status is not None:
+        query = query.where(Order.status == expected_status)
+    return query
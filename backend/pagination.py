@@ -0,0 +1,85 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from functools import lru_cache
+from uuid import UUID
+
+from fastapi import HTTPException, Query
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PageParams:
+    """Dependency collecting the `cursor` and `limit` query parameters."""
+
+    def __init__(
+        self,
+        cursor: str | None = Query(
+            None, description="Opaque cursor from a previous page"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+@lru_cache(maxsize=None)
+def schema_columns(model, schema) -> tuple:
+    """Columns of `model` that `schema` reads, plus the (created_at, id) sort key.
+
+    Selecting these instead of the entity returns plain Rows: nothing is added
+    to the session's identity map, unused columns (such as users.password)
+    are never fetched, and pydantic reads Rows by attribute like ORM objects.
+    """
+    names = [name for name in schema.model_fields if name in model.__table__.columns]
+    names += [name for name in ("created_at", "id") if name not in names]
+    return tuple(getattr(model, name) for name in names)
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Encodes the sort key of the last row of a page into an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), str(id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decodes a cursor produced by `encode_cursor`, answering 400 if malformed."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not (isinstance(key, list) and len(key) == 2
+                and all(isinstance(value, str) for value in key)):
+            raise ValueError("expected [created_at, id]")
+        return datetime.fromisoformat(key[0]), UUID(key[1])
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate(db: AsyncSession, query, model, page: PageParams) -> dict:
+    """Runs `query` as one page ordered by (created_at, id).
+
+    Rows after the cursor are fetched with a keyset condition, so the cost of
+    a page does not depend on how deep into the result set it is. `query`
+    selects either the `model` entity, giving ORM instances, or columns from
+    `schema_columns`, giving Rows.
+    """
+    if page.cursor:
+        created_at, id = decode_cursor(page.cursor)
+        query = query.where(
+            tuple_(model.created_at, model.id) > tuple_(created_at, id))
+    query = query.order_by(model.created_at, model.id).limit(page.limit + 1)
+
+    result = await db.execute(query)
+    if len(query.column_descriptions) == 1:
+        rows = result.scalars().all()
+    else:
+        rows = result.all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return {"items": rows, "next_cursor": next_cursor}
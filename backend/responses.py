@@ -0,0 +1,37 @@
+from functools import lru_cache
+from typing import Any, Mapping
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def type_adapter(schema) -> TypeAdapter:
+    """One TypeAdapter per schema, so its validator and serializer are built once."""
+    return TypeAdapter(schema)
+
+
+class PydanticJSONResponse(Response):
+    """JSON response rendered by pydantic-core straight to bytes.
+
+    Returning a plain object makes FastAPI validate it against the route's
+    `response_model`, convert it with `jsonable_encoder` and encode it with
+    the stdlib json module. Endpoints that opt in by returning this response
+    instead do a single validation of `content` (ORM objects included) and a
+    single `dump_json`, both in Rust. Keep `response_model` on the route for
+    the OpenAPI schema.
+
+    FastAPI does not merge headers set on the injected `response` parameter
+    into a response returned directly, so pass them as `headers` to keep
+    the ETag.
+    """
+    media_type = "application/json"
+
+    def __init__(self, schema, content: Any, status_code: int = 200,
+                 headers: Mapping[str, str] | None = None):
+        self.schema = schema
+        super().__init__(content, status_code, headers)
+
+    def render(self, content: Any) -> bytes:
+        adapter = type_adapter(self.schema)
+        return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
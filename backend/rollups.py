@@ -0,0 +1,90 @@
+from typing import Collection
+from uuid import UUID
+
+from sqlalchemy import delete, distinct, func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.order_items import OrderItem
+from backend.models.order_rollups import OrderRollup
+from backend.models.orders import Order
+from backend.models.sales_rollups import SalesRollup
+from backend.order_status import STATUS_FLOW
+
+COMPLETED = STATUS_FLOW[-1]
+GRANULARITIES = ("hour", "day")
+
+
+def _rollup_statements(condition):
+    """Upserts adding the completed orders matching `condition` to the rollups.
+
+    Orders are bucketed by the UTC time they were placed. Each statement
+    groups by the full rollup key, so a key appears at most once per
+    statement and ON CONFLICT can add to the existing totals. Lines whose
+    menu item was deleted are only in the order totals, see SalesRollup.
+    """
+    line_total = OrderItem.quantity * OrderItem.price
+    for granularity in GRANULARITIES:
+        bucket = func.date_trunc(granularity, Order.created_at)
+
+        sales = select(
+            Order.restaurant_id, literal(granularity), bucket,
+            OrderItem.menu_item_id, func.sum(OrderItem.quantity),
+            func.sum(line_total), func.count(distinct(Order.id))
+        ).join(OrderItem, OrderItem.order_id == Order.id)\
+            .where(condition)\
+            .where(OrderItem.menu_item_id.is_not(None))\
+            .group_by(Order.restaurant_id, bucket, OrderItem.menu_item_id)
+        statement = insert(SalesRollup).from_select(
+            ["restaurant_id", "granularity", "bucket_start", "menu_item_id",
+             "quantity", "revenue", "order_count"], sales)
+        yield statement.on_conflict_do_update(
+            index_elements=["restaurant_id", "granularity", "bucket_start", "menu_item_id"],
+            set_={
+                "quantity": SalesRollup.quantity + statement.excluded.quantity,
+                "revenue": SalesRollup.revenue + statement.excluded.revenue,
+                "order_count": SalesRollup.order_count + statement.excluded.order_count,
+            }
+        )
+
+        orders = select(
+            Order.restaurant_id, literal(granularity), bucket,
+            func.count(), func.sum(Order.total_amount)
+        ).where(condition)\
+            .group_by(Order.restaurant_id, bucket)
+        statement = insert(OrderRollup).from_select(
+            ["restaurant_id", "granularity", "bucket_start", "order_count", "revenue"], orders)
+        yield statement.on_conflict_do_update(
+            index_elements=["restaurant_id", "granularity", "bucket_start"],
+            set_={
+                "order_count": OrderRollup.order_count + statement.excluded.order_count,
+                "revenue": OrderRollup.revenue + statement.excluded.revenue,
+            }
+        )
+
+
+async def record_completed_orders(db: AsyncSession, orders) -> None:
+    """Adds the orders that just moved to completed to the rollups.
+
+    Takes the rows returned by a status transition and must run in the same
+    transaction, so each completion is counted exactly once.
+    """
+    order_ids = [order["id"] for order in orders if order["status"] == COMPLETED]
+    if order_ids:
+        for statement in _rollup_statements(Order.id.in_(order_ids)):
+            await db.execute(statement)
+
+
+async def rebuild_rollups(db: AsyncSession, restaurant_ids: Collection[UUID]) -> None:
+    """Recomputes the rollups of some restaurants from their completed orders.
+
+    The lock makes concurrent completions wait until the rebuild commits, so
+    each one is counted either by the rebuild or by its own upsert, never both.
+    """
+    await db.execute(text(
+        "LOCK TABLE sales_rollups, order_rollups IN SHARE ROW EXCLUSIVE MODE"))
+    await db.execute(delete(SalesRollup).where(SalesRollup.restaurant_id.in_(restaurant_ids)))
+    await db.execute(delete(OrderRollup).where(OrderRollup.restaurant_id.in_(restaurant_ids)))
+    condition = Order.restaurant_id.in_(restaurant_ids) & (Order.status == COMPLETED)
+    for statement in _rollup_statements(condition):
+        await db.execute(statement)
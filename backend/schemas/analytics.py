@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from uuid import UUID
+from datetime import datetime
+from decimal import Decimal
+
+
+class SalesBucket(BaseModel):
+    """Completed orders and revenue in one hour or day."""
+    bucket_start: datetime
+    order_count: int
+    revenue: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class TopMenuItem(BaseModel):
+    """Sales of one menu item over the requested range."""
+    menu_item_id: UUID
+    name: str | None  # None once the item has been deleted from the menu
+    quantity: int
+    revenue: Decimal
+    order_count: int
+
+    class Config:
+        from_attributes = True
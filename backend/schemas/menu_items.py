@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from uuid import UUID
+from typing import List
 
 
 class MenuItemCreate(BaseModel):
@@ -29,3 +30,16 @@ class MenuItemUpdate(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class MenuImportRowError(BaseModel):
+    """A row rejected by the bulk menu import."""
+    line: int  # 1-based line number in the uploaded file
+    error: str
+
+
+class MenuImportResult(BaseModel):
+    """Summary of a bulk menu import."""
+    inserted: int
+    failed: int
+    errors: List[MenuImportRowError]  # Capped, see `failed` for the full count
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from decimal import Decimal
 
@@ -8,18 +8,22 @@ class OrderItemCreate(BaseModel):
     id: UUID | None = None
     order_id: UUID | None = None
     menu_item_id: UUID
-    quantity: int
-    price: Decimal
+    quantity: int = Field(gt=0)
+    price: Decimal | None = None  # Set from the menu when the order is created
 
     class Config:
         from_attributes = True
 
 
 class OrderItemUpdate(BaseModel):
-    """Schema for updating an existing order."""
+    """Schema for updating an existing order item, also returned when reading them.
+
+    Unlike OrderItemCreate it has no constraints, so rows stored before a
+    constraint was added can still be read.
+    """
     id: UUID | None = None
     order_id: UUID | None = None
-    menu_item_id: UUID | None = None
+    menu_item_id: UUID | None = None  # None once the menu item has been deleted
     quantity: int | None = None
     price: Decimal | None = None
 
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
-from typing import List
+from decimal import Decimal
+from typing import List, Literal
 
 from backend.schemas.order_items import OrderItemCreate
 
@@ -13,6 +14,8 @@ class OrderCreate(BaseModel):
     # 'pending', 'preparing', 'ready', 'completed' and 'cancelled'
     status: str | None = None
     name: str | None = None
+    item_count: int | None = None
+    total_amount: Decimal | None = None
 
     class Config:
         from_attributes = True
@@ -22,9 +25,11 @@ class OrderCreateWithItems(BaseModel):
     id: UUID | None = None
     user_id: UUID | None = None
     restaurant_id: UUID | None = None
-    order_items: List[OrderItemCreate]
+    order_items: List[OrderItemCreate] = Field(min_length=1)
     status: str | None = None
     name: str | None = None
+    item_count: int | None = None
+    total_amount: Decimal | None = None
 
 
 class OrderUpdate(BaseModel):
@@ -32,8 +37,25 @@ class OrderUpdate(BaseModel):
     id: UUID | None = None
     restaurant_id: UUID | None = None
     user_id: UUID | None = None
-    status: str  # 'pending', 'preparing', 'ready', 'completed' and 'cancelled'
+    # 'pending', 'preparing', 'ready', 'completed' and 'cancelled'; changed
+    # through next-status and cancel, not on update
+    status: str | None = None
     name: str | None = None
+    # Maintained from the order's items; ignored on update
+    item_count: int | None = None
+    total_amount: Decimal | None = None
 
     class Config:
         from_attributes = True
+
+
+class OrderBulkStatusUpdate(BaseModel):
+    """Schema for moving many orders to their next status or cancelling them."""
+    order_ids: List[UUID] = Field(min_length=1, max_length=500)
+    action: Literal["advance", "cancel"]
+
+
+class OrderBulkStatusResult(BaseModel):
+    """Result of a bulk status change."""
+    updated: List[OrderUpdate]
+    invalid_ids: List[UUID]  # Missing, in another restaurant, or not allowed to move
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """Schema for a page of results from a list endpoint."""
+    items: List[T]
+    next_cursor: str | None = None  # Pass back as `cursor` to get the next page
@@ -1,7 +1,15 @@
+import asyncio
+import hmac
 import jwt
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from threading import Lock
 from passlib.context import CryptContext
 from fastapi import HTTPException, Request, Depends, status
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer
 
 from typing import List
@@ -17,14 +25,101 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
-def hash_password(password: str) -> str:
+class HashPoolMetrics:
+    """Counters for the password hashing pool, updated from worker threads."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.completed = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.hash_seconds_total = 0.0
+        self.hash_seconds_max = 0.0
+        self.queue_wait_seconds_total = 0.0
+        self.queue_wait_seconds_max = 0.0
+
+    def acquire(self, capacity: int) -> bool:
+        """Takes a slot in the pool, or counts a rejection when all are taken."""
+        with self._lock:
+            if self.in_flight >= capacity:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, _future=None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def record(self, queue_wait: float, hash_time: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.queue_wait_seconds_total += queue_wait
+            self.queue_wait_seconds_max = max(
+                self.queue_wait_seconds_max, queue_wait)
+            self.hash_seconds_total += hash_time
+            self.hash_seconds_max = max(self.hash_seconds_max, hash_time)
+
+    def stats(self) -> dict:
+        with self._lock:
+            completed = self.completed
+            return {
+                "workers": settings.PASSWORD_HASH_WORKERS,
+                "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+                "in_flight": self.in_flight,
+                "completed": completed,
+                "rejected": self.rejected,
+                "hash_seconds_avg": self.hash_seconds_total / completed if completed else 0.0,
+                "hash_seconds_max": self.hash_seconds_max,
+                "queue_wait_seconds_avg": self.queue_wait_seconds_total / completed if completed else 0.0,
+                "queue_wait_seconds_max": self.queue_wait_seconds_max,
+            }
+
+
+# bcrypt releases the GIL, so a thread pool keeps it off the event loop
+hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+hash_metrics = HashPoolMetrics()
+
+
+async def run_in_hash_pool(func, *args):
+    """Runs a bcrypt call in the hash pool, answering 503 when it is saturated."""
+    capacity = settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+    if not hash_metrics.acquire(capacity):
+        logger.warning("Password hashing pool saturated")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy, please retry",
+            headers={"Retry-After": "1"}
+        )
+
+    submitted = time.perf_counter()
+
+    def timed_call():
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            hash_metrics.record(started - submitted,
+                                time.perf_counter() - started)
+
+    future = hash_executor.submit(timed_call)
+    # Free the slot when the thread is done, not when this coroutine resumes:
+    # a cancelled request (client gone) leaves the hash running in the pool.
+    future.add_done_callback(hash_metrics.release)
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password(password: str) -> str:
     """Hashes a password using bcrypt."""
-    return pwd_context.hash(password)
+    return await run_in_hash_pool(pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return await run_in_hash_pool(pwd_context.verify, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
@@ -35,10 +130,52 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+class TokenCache:
+    """LRU of verified tokens, each entry expiring with the token's `exp`.
+
+    A cached token skips signature verification on repeat requests. Entries
+    are keyed by the full token string, so a modified token never matches.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, token: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return payload
+
+    def put(self, token: str, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if self.max_entries <= 0 or expires_at is None:
+            return
+        with self._lock:
+            self._entries[token] = (payload, float(expires_at))
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE)
+
+
 def verify_access_token(token: str):
-    """Decodes and verifies a JWT token."""
+    """Decodes and verifies a JWT token, reusing recently verified tokens."""
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        token_cache.put(token, payload)
         return payload
     except jwt.ExpiredSignatureError:
         logger.info("Token expired")
@@ -48,23 +185,70 @@ def verify_access_token(token: str):
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
-def get_current_user(request: Request):
-    # Extract token from the Authorization header
-    authorization_header = request.headers.get("Authorization")
+def user_from_authorization(authorization_header: str | None) -> dict:
+    """Verifies a 'Bearer <token>' header value and returns its claims."""
     if not authorization_header:
         raise HTTPException(
             status_code=401, detail="Authorization header missing")
 
     # Split the 'Bearer token' part
-    token_type, token = authorization_header.split()
-    if token_type.lower() != "bearer":
+    parts = authorization_header.split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
         raise HTTPException(status_code=401, detail="Invalid token type")
 
-    # Verify the token and return the payload
-    payload = verify_access_token(token)
+    return verify_access_token(parts[1])
+
+
+def get_current_user(request: Request):
+    # Claims already verified earlier in this request (by AuthMiddleware)
+    payload = getattr(request.state, "user", None)
+    if payload is not None:
+        return payload
+
+    # Verify the token, keep the claims for the rest of the request
+    payload = user_from_authorization(request.headers.get("Authorization"))
+    request.state.user = payload
     return payload  # Returns the decoded token (user data)
 
 
+# Paths served without an access token, matched against the whole request
+# path. /metrics checks its own scrape token in require_metrics_access.
+PUBLIC_PATHS = re.compile(
+    r"/(?:docs|docs/oauth2-redirect|openapi\.json|login/?|register/?|metrics)")
+
+
+class AuthMiddleware:
+    """ASGI middleware rejecting requests without a valid bearer token.
+
+    The verified claims are stored in scope["state"]["user"], which is where
+    request.state.user reads from, so get_current_user does not verify the
+    token a second time.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or PUBLIC_PATHS.fullmatch(scope["path"]):
+            return await self.app(scope, receive, send)
+
+        authorization_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization_header = value.decode("latin-1")
+                break
+        try:
+            payload = user_from_authorization(authorization_header)
+        except HTTPException:
+            logger.info("Unauthorized")
+            response = JSONResponse(
+                {"detail": "Unauthorized access"}, status_code=401)
+            return await response(scope, receive, send)
+
+        scope.setdefault("state", {})["user"] = payload
+        await self.app(scope, receive, send)
+
+
 def require_user_type(allowed_user_types: List[str]):
     """Dependency to restrict access based on user roles."""
     def user_type_checker(current_user: dict = Depends(get_current_user)):
@@ -75,3 +259,16 @@ def require_user_type(allowed_user_types: List[str]):
             )
         return current_user
     return user_type_checker
+
+
+def require_metrics_access(request: Request) -> None:
+    """Dependency admitting METRICS_TOKEN as a bearer token, or an admin's access token."""
+    authorization_header = request.headers.get("Authorization") or ""
+    if settings.METRICS_TOKEN and hmac.compare_digest(
+            authorization_header.encode(), f"Bearer {settings.METRICS_TOKEN}".encode()):
+        return
+    if get_current_user(request).get("user_type") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have permission to access this resource."
+        )
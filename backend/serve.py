@@ -0,0 +1,95 @@
+"""Production entry point: `python -m backend.serve`.
+
+Runs backend.main:app under uvicorn with one worker process per available
+CPU (or WEB_WORKERS), without the reloader. Available CPUs respect both the
+affinity mask and a container's CPU quota. uvloop and httptools are used
+when installed. On SIGTERM each worker stops accepting connections and gives
+in-flight requests up to WEB_GRACEFUL_SHUTDOWN_SECONDS to finish.
+"""
+import math
+import os
+from importlib.util import find_spec
+
+import uvicorn
+
+from backend.config import settings
+from backend.logger import logger
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def cpu_quota(cgroup_root: str = CGROUP_ROOT) -> int | None:
+    """CPUs granted by the cgroup CPU quota, rounded up, or None if unlimited.
+
+    Container runtimes (docker --cpus, ECS task cpu, Kubernetes limits)
+    throttle with a CFS quota while still showing every host CPU to the
+    affinity mask. cgroup v2 exposes "<quota> <period>" or "max <period>"
+    in cpu.max; cgroup v1 has cpu.cfs_quota_us (-1 when unlimited) and
+    cpu.cfs_period_us.
+    """
+    try:
+        with open(os.path.join(cgroup_root, "cpu.max")) as f:
+            quota, period = f.read().split()
+    except (OSError, ValueError):
+        try:
+            with open(os.path.join(cgroup_root, "cpu", "cpu.cfs_quota_us")) as f:
+                quota = f.read().strip()
+            with open(os.path.join(cgroup_root, "cpu", "cpu.cfs_period_us")) as f:
+                period = f.read().strip()
+        except OSError:
+            return None
+    if quota in ("max", "-1"):
+        return None
+    return max(1, math.ceil(int(quota) / int(period)))
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: its affinity mask, capped by the CPU quota."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    quota = cpu_quota()
+    return min(cpus, quota) if quota else cpus
+
+
+def size_db_pool(workers: int) -> None:
+    """Splits DB_MAX_CONNECTIONS evenly between the workers' pools.
+
+    Each worker builds its own engine from the environment, so the sizes are
+    exported before the workers start. The order event listener holds one
+    more connection per worker, outside the pool.
+    """
+    if settings.DB_MAX_CONNECTIONS <= 0:
+        return
+    pool_size = max(1, settings.DB_MAX_CONNECTIONS // workers)
+    for name, value in (("DB_POOL_SIZE", pool_size), ("DB_MAX_OVERFLOW", 0)):
+        os.environ[name] = str(value)
+        # A single worker runs in this process, with these settings
+        setattr(settings, name, value)
+
+
+def main() -> None:
+    workers = settings.WEB_WORKERS or available_cpus()
+    size_db_pool(workers)
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    logger.info(
+        f"Starting {workers} workers on {settings.WEB_HOST}:{settings.WEB_PORT} "
+        f"(loop={loop}, http={http}, db pool={settings.DB_POOL_SIZE}"
+        f"+{settings.DB_MAX_OVERFLOW} per worker)")
+
+    uvicorn.run(
+        "backend.main:app",
+        host=settings.WEB_HOST,
+        port=settings.WEB_PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=settings.WEB_KEEP_ALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.WEB_GRACEFUL_SHUTDOWN_SECONDS,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare the old joined eager loading of orders with lazy loading.
+
+Seeds one restaurant with orders and order items inside a transaction that
+is rolled back at the end, then runs the restaurant-wide order query both
+ways: with the former `lazy="joined"` profile (user, order items with their
+menu items, restaurant) and with the current lazy default. For each it
+reports the number of rows the database returned and the query latency.
+
+Usage:
+    python -m scripts.bench_order_loading --orders 2000 --items 4
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import joinedload
+
+from backend.database import engine
+from backend.models.menu_items import MenuItem
+from backend.models.order_items import OrderItem
+from backend.models.orders import Order
+from backend.models.restaurants import Restaurant
+from backend.models.users import User
+
+
+async def seed(conn, orders: int, items: int) -> uuid.UUID:
+    """Inserts one restaurant with `orders` orders of `items` items each."""
+    restaurant_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    await conn.execute(insert(Restaurant), [dict(
+        id=restaurant_id, name="Bench", phone="0", address="-", city="-",
+        state="-", zip_code="-")])
+    await conn.execute(insert(User), [dict(
+        id=user_id, restaurant_id=restaurant_id, name="Bench", phone="0",
+        email=f"bench-{user_id}@example.com", password="-",
+        user_type="customer")])
+
+    menu_ids = [uuid.uuid4() for _ in range(20)]
+    await conn.execute(insert(MenuItem), [dict(
+        id=menu_id, restaurant_id=restaurant_id, name=f"Item {i}",
+        price=Decimal("9.50"), category="food")
+        for i, menu_id in enumerate(menu_ids)])
+
+    start = datetime.now() - timedelta(days=30)
+    order_rows, item_rows = [], []
+    for i in range(orders):
+        order_id = uuid.uuid4()
+        order_rows.append(dict(
+            id=order_id, restaurant_id=restaurant_id, user_id=user_id,
+            status="completed", created_at=start + timedelta(minutes=i)))
+        item_rows.extend(dict(
+            id=uuid.uuid4(), order_id=order_id,
+            menu_item_id=menu_ids[(i + j) % len(menu_ids)], quantity=1,
+            price=Decimal("9.50")) for j in range(items))
+    await conn.execute(insert(Order), order_rows)
+    await conn.execute(insert(OrderItem), item_rows)
+    await conn.execute(text("ANALYZE orders"))
+    await conn.execute(text("ANALYZE order_items"))
+    return restaurant_id
+
+
+async def measure(conn, query, repeat: int) -> tuple[int, list[float]]:
+    """Runs the compiled query `repeat` times; returns row count and timings."""
+    sql = str(query.compile(dialect=postgresql.asyncpg.dialect(),
+                            compile_kwargs={"literal_binds": True}))
+    timings, rows = [], 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await conn.execute(text(sql))
+        rows = len(result.all())
+        timings.append(time.perf_counter() - started)
+    return rows, timings
+
+
+async def main(args) -> None:
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            restaurant_id = await seed(conn, args.orders, args.items)
+            base = select(Order).where(Order.restaurant_id == restaurant_id)
+            profiles = {
+                "joined (before)": base.options(
+                    joinedload(Order.user),
+                    joinedload(Order.order_items)
+                    .joinedload(OrderItem.menu_items),
+                    joinedload(Order.restaurant)),
+                "lazy (after)": base,
+            }
+            print(f"{'profile':<18}{'rows':>8}{'p50 ms':>10}{'max ms':>10}")
+            for name, query in profiles.items():
+                rows, timings = await measure(conn, query, args.repeat)
+                print(f"{name:<18}{rows:>8}"
+                      f"{statistics.median(timings) * 1000:>10.2f}"
+                      f"{max(timings) * 1000:>10.2f}")
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
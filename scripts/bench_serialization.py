@@ -0,0 +1,84 @@
+"""Compare the default response path with PydanticJSONResponse on large pages.
+
+Builds `--rows` transient Order instances (no database) and serves them as a
+Page[OrderCreate] from two routes of a minimal app: one returning the page
+for FastAPI to validate against `response_model`, run through
+`jsonable_encoder` and encode with json, the other returning a
+PydanticJSONResponse. Both are called in process; the script checks that
+they produce the same JSON and reports CPU time per response.
+
+Usage:
+    python -m scripts.bench_serialization --rows 10000 --repeat 20
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi import FastAPI
+
+from backend.models.orders import Order
+from backend.responses import PydanticJSONResponse
+from backend.schemas.orders import OrderCreate
+from backend.schemas.pagination import Page
+from scripts.harness import ASGIClient
+
+
+def build_page(rows: int) -> dict:
+    restaurant_id = uuid.uuid4()
+    start = datetime(2026, 1, 1)
+    return {
+        "items": [
+            Order(id=uuid.uuid4(), restaurant_id=restaurant_id, user_id=uuid.uuid4(),
+                  name=f"Order {i}", status="completed", item_count=3,
+                  total_amount=Decimal("27.50"), created_at=start + timedelta(seconds=i))
+            for i in range(rows)
+        ],
+        "next_cursor": None,
+    }
+
+
+def build_app(page: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=Page[OrderCreate])
+    async def default():
+        return page
+
+    @app.get("/fast", response_model=Page[OrderCreate])
+    async def fast():
+        return PydanticJSONResponse(Page[OrderCreate], page)
+
+    return app
+
+
+async def measure(client: ASGIClient, path: str, repeat: int) -> tuple[float, bytes]:
+    body = (await client.request("GET", path)).body
+    started = time.process_time()
+    for _ in range(repeat):
+        await client.request("GET", path)
+    return (time.process_time() - started) / repeat, body
+
+
+async def main(args) -> None:
+    client = ASGIClient(build_app(build_page(args.rows)))
+    default_cpu, default_body = await measure(client, "/default", args.repeat)
+    fast_cpu, fast_body = await measure(client, "/fast", args.repeat)
+    assert json.loads(default_body) == json.loads(fast_body), "Responses differ"
+
+    print(f"{args.rows} rows, {len(fast_body) / 1024:.0f} KiB per response")
+    print(f"{'path':<10}{'cpu ms':>10}")
+    print(f"{'default':<10}{default_cpu * 1000:>10.1f}")
+    print(f"{'fast':<10}{fast_cpu * 1000:>10.1f}")
+    print(f"CPU saved: {(1 - fast_cpu / default_cpu) * 100:.0f}% "
+          f"({default_cpu / fast_cpu:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,261 @@
+"""Bulk-load synthetic restaurants, menus, users and orders with COPY.
+
+Data follows the shapes that matter for indexes and benchmarks:
+
+- order volume per restaurant is Pareto distributed, so a few restaurants
+  take most orders while the long tail sees only a handful;
+- within a menu a few dishes are ordered far more often than the rest;
+- orders are spread over `--days` days with lunch and dinner peaks, ending
+  at midnight of `--until`;
+- orders from the last two hours are still pending, preparing or ready,
+  older ones are completed or occasionally cancelled.
+
+The same seed, preset and `--until` always produce the same rows, ids and
+password hashes included: every user gets the same password, hashed once
+up front with a salt derived from the seed. The sales rollups of the new
+restaurants are built from their completed orders at the end.
+
+The database in DATABASE_URL should be migrated to head. Use `--truncate`
+to empty the tables first.
+
+Usage:
+    python -m scripts.generate_data --preset medium --seed 42 --truncate
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import text
+
+from backend.database import async_session_factory, connect_asyncpg, engine
+from backend.models.menu_items import MenuItem
+from backend.models.order_items import OrderItem
+from backend.models.orders import Order
+from backend.models.restaurants import Restaurant
+from backend.models.users import User
+from backend.order_status import CANCELLED, STATUS_FLOW
+from backend.rollups import rebuild_rollups
+from backend.security import pwd_context
+
+PRESETS = {
+    # restaurants, customers, orders
+    "small": (20, 2_000, 50_000),
+    "medium": (500, 50_000, 1_000_000),
+    "large": (2_000, 200_000, 5_000_000),
+}
+
+PASSWORD = "generated-password"
+BCRYPT_SALT_CHARS = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+WORKERS_PER_RESTAURANT = 3
+MENU_SIZE = (15, 80)
+ITEMS_PER_ORDER = (1, 5)
+PARETO_ALPHA = 1.16  # roughly 80% of orders go to 20% of restaurants
+CANCELLED_SHARE = 0.08
+OPEN_ORDER_WINDOW = timedelta(hours=2)
+ORDER_BATCH_SIZE = 50_000
+
+# Relative order volume by hour of day
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 4, 6, 8, 7, 8, 14,
+                20, 16, 9, 7, 8, 12, 18, 20, 16, 10, 5, 2]
+
+CATEGORIES = ["food", "food", "food", "drink", "dessert"]
+CITIES = [("Springfield", "IL"), ("Portland", "OR"), ("Austin", "TX"),
+          ("Madison", "WI"), ("Raleigh", "NC"), ("Boise", "ID")]
+
+RESTAURANT_COLUMNS = ("id", "name", "phone", "address", "city", "state",
+                      "zip_code", "description", "created_at")
+USER_COLUMNS = ("id", "restaurant_id", "name", "phone", "email", "password",
+                "user_type", "active", "created_at")
+MENU_ITEM_COLUMNS = ("id", "restaurant_id", "name", "description", "price",
+                     "category", "available", "created_at")
+ORDER_COLUMNS = ("id", "restaurant_id", "user_id", "name", "status",
+                 "item_count", "total_amount", "created_at")
+ORDER_ITEM_COLUMNS = ("id", "order_id", "menu_item_id", "quantity", "price",
+                      "created_at")
+
+
+class Generator:
+    """Deterministic row factory; all randomness comes from one seeded RNG."""
+
+    def __init__(self, seed: int, days: int, until: date):
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.end = datetime.combine(until, datetime.min.time())
+        self.start = self.end - timedelta(days=days)
+        self.days = days
+        self.password = self.password_hash(seed)
+
+    @staticmethod
+    def password_hash(seed: int) -> str:
+        """bcrypt hash of PASSWORD with a salt derived from the seed.
+
+        The salt has its own RNG, so the rows do not depend on it. The last
+        of its 22 characters only carries 2 bits, hence the narrower choice.
+        """
+        rng = random.Random(f"password-{seed}")
+        salt = "".join(rng.choice(BCRYPT_SALT_CHARS) for _ in range(21)) + rng.choice(".Oeu")
+        return pwd_context.handler("bcrypt").using(salt=salt).hash(PASSWORD)
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def moment(self) -> datetime:
+        """A timestamp in the window, weighted towards meal times."""
+        rng = self.rng
+        hour = rng.choices(range(24), HOUR_WEIGHTS)[0]
+        return self.start + timedelta(
+            days=rng.randrange(self.days), hours=hour,
+            seconds=rng.randrange(3600), microseconds=rng.randrange(1_000_000))
+
+    def status(self, created_at: datetime) -> str:
+        if self.end - created_at < OPEN_ORDER_WINDOW:
+            return self.rng.choice(STATUS_FLOW[:-1])
+        return CANCELLED if self.rng.random() < CANCELLED_SHARE else STATUS_FLOW[-1]
+
+    def restaurants(self, count: int) -> list[tuple]:
+        rows = []
+        for i in range(count):
+            city, state = self.rng.choice(CITIES)
+            rows.append((
+                self.uuid(), f"Restaurant {i}", f"555-{i % 10_000:04d}",
+                f"{self.rng.randrange(1, 9999)} Main St", city, state,
+                f"{self.rng.randrange(10_000, 99_999)}", None, self.start))
+        return rows
+
+    def menus(self, restaurant_ids: list) -> tuple[dict, list]:
+        """Menu rows per restaurant as (id, price) pairs plus the COPY records."""
+        menus, rows = {}, []
+        for restaurant_id in restaurant_ids:
+            items = []
+            for i in range(self.rng.randint(*MENU_SIZE)):
+                item_id = self.uuid()
+                price = Decimal(self.rng.randrange(300, 3500)) / 100
+                items.append((item_id, price))
+                rows.append((
+                    item_id, restaurant_id, f"Dish {i}", None, price,
+                    self.rng.choice(CATEGORIES), True, self.start))
+            menus[restaurant_id] = items
+        return menus, rows
+
+    def users(self, restaurant_ids: list, customers: int) -> tuple[list, list]:
+        rows, customer_ids = [], []
+        for r, restaurant_id in enumerate(restaurant_ids):
+            for w in range(WORKERS_PER_RESTAURANT):
+                rows.append((
+                    self.uuid(), restaurant_id, f"Worker {r}-{w}", "555-0100",
+                    f"worker-{self.seed}-{r}-{w}@example.com", self.password,
+                    "restaurant_worker", True, self.start))
+        for i in range(customers):
+            user_id = self.uuid()
+            customer_ids.append(user_id)
+            rows.append((
+                user_id, None, f"Customer {i}", "555-0100",
+                f"customer-{self.seed}-{i}@example.com", self.password,
+                "customer", True, self.moment()))
+        return rows, customer_ids
+
+    def orders(self, count: int, restaurant_ids: list, menus: dict, customer_ids: list):
+        """Yields (order rows, order item rows) in batches of ORDER_BATCH_SIZE."""
+        rng = self.rng
+        restaurant_weights = [rng.paretovariate(PARETO_ALPHA) for _ in restaurant_ids]
+        # Popular dishes first: the i-th dish is ordered about 1/(i+1) as often
+        dish_weights = [1 / (i + 1) for i in range(MENU_SIZE[1])]
+
+        remaining = count
+        while remaining:
+            size = min(ORDER_BATCH_SIZE, remaining)
+            remaining -= size
+            order_rows, item_rows = [], []
+            for restaurant_id in rng.choices(restaurant_ids, restaurant_weights, k=size):
+                order_id = self.uuid()
+                created_at = self.moment()
+                menu = menus[restaurant_id]
+                item_count, total_amount = 0, Decimal(0)
+                for menu_item_id, price in rng.choices(
+                        menu, dish_weights[:len(menu)], k=rng.randint(*ITEMS_PER_ORDER)):
+                    quantity = rng.randint(1, 3)
+                    item_count += quantity
+                    total_amount += quantity * price
+                    item_rows.append((
+                        self.uuid(), order_id, menu_item_id, quantity,
+                        price, created_at))
+                order_rows.append((
+                    order_id, restaurant_id, rng.choice(customer_ids), None,
+                    self.status(created_at), item_count, total_amount, created_at))
+            yield order_rows, item_rows
+
+
+async def copy(conn, model, columns, rows) -> None:
+    started = time.perf_counter()
+    await conn.copy_records_to_table(
+        model.__tablename__, records=rows, columns=columns)
+    print(f"  {model.__tablename__:<12} {len(rows):>10,} rows "
+          f"in {time.perf_counter() - started:.1f}s")
+
+
+async def main(args) -> None:
+    restaurants, customers, orders = PRESETS[args.preset]
+    restaurants = args.restaurants or restaurants
+    customers = args.customers or customers
+    orders = args.orders or orders
+
+    started = time.perf_counter()
+    generator = Generator(args.seed, args.days, args.until)
+    conn = await connect_asyncpg()
+    try:
+        if args.truncate:
+            await conn.execute(
+                "TRUNCATE sales_rollups, order_rollups, order_items, orders, "
+                "menu_items, users, restaurants")
+
+        restaurant_rows = generator.restaurants(restaurants)
+        restaurant_ids = [row[0] for row in restaurant_rows]
+        menus, menu_rows = generator.menus(restaurant_ids)
+        user_rows, customer_ids = generator.users(restaurant_ids, customers)
+
+        async with conn.transaction():
+            await copy(conn, Restaurant, RESTAURANT_COLUMNS, restaurant_rows)
+            await copy(conn, MenuItem, MENU_ITEM_COLUMNS, menu_rows)
+            await copy(conn, User, USER_COLUMNS, user_rows)
+
+        # One transaction per batch keeps memory flat and progress visible
+        for order_rows, item_rows in generator.orders(
+                orders, restaurant_ids, menus, customer_ids):
+            async with conn.transaction():
+                await copy(conn, Order, ORDER_COLUMNS, order_rows)
+                await copy(conn, OrderItem, ORDER_ITEM_COLUMNS, item_rows)
+
+    finally:
+        await conn.close()
+
+    # Orders loaded with COPY skip the completion path that maintains rollups
+    rollups_started = time.perf_counter()
+    async with async_session_factory() as db:
+        await rebuild_rollups(db, restaurant_ids)
+        await db.execute(text("ANALYZE"))
+        await db.commit()
+    await engine.dispose()
+    print(f"  rollups      built in {time.perf_counter() - rollups_started:.1f}s")
+
+    print(f"Generated {restaurants:,} restaurants, {customers:,} customers and "
+          f"{orders:,} orders in {time.perf_counter() - started:.0f}s "
+          f"(password: {PASSWORD})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=PRESETS, default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--restaurants", type=int, help="Overrides the preset")
+    parser.add_argument("--customers", type=int, help="Overrides the preset")
+    parser.add_argument("--orders", type=int, help="Overrides the preset")
+    parser.add_argument("--days", type=int, default=180, help="Days of order history")
+    parser.add_argument("--until", type=date.fromisoformat, default=date.today(),
+                        help="Last day of order history (YYYY-MM-DD)")
+    parser.add_argument("--truncate", action="store_true",
+                        help="Empty all tables before loading")
+    asyncio.run(main(parser.parse_args()))
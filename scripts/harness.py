@@ -0,0 +1,157 @@
+"""In-process client and API seeding shared by the tests and benchmark scripts.
+
+Requests go straight into the ASGI app, through every middleware, without a
+network hop or an extra HTTP client dependency. The app talks to the database
+in DATABASE_URL, which should be a local Postgres migrated to head.
+"""
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ASGIResponse:
+    status: int
+    headers: dict
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class ASGIClient:
+    """Minimal async client for calling an ASGI app in process."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method: str, path: str, json_body=None,
+                      token: str | None = None, headers: dict | None = None,
+                      body: bytes | None = None) -> ASGIResponse:
+        path, _, query = path.partition("?")
+        request_headers = {"host": "testserver", **(headers or {})}
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            request_headers["content-type"] = "application/json"
+        if token is not None:
+            request_headers["authorization"] = f"Bearer {token}"
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(name.lower().encode(), value.encode())
+                        for name, value in request_headers.items()],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        pending = [{"type": "http.request", "body": body or b"",
+                    "more_body": False}]
+        disconnected = asyncio.Event()
+
+        async def receive():
+            if pending:
+                return pending.pop(0)
+            # Streaming responses watch for a disconnect until they finish
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        status, response_headers, chunks = 500, {}, []
+
+        async def send(message):
+            nonlocal status, response_headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers = {name.decode(): value.decode()
+                                    for name, value in message["headers"]}
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            disconnected.set()
+        return ASGIResponse(status, response_headers, b"".join(chunks))
+
+    async def expect(self, method: str, path: str, status: int = 200, **kwargs):
+        """Sends a request and raises unless it returns `status`."""
+        response = await self.request(method, path, **kwargs)
+        if response.status != status:
+            raise RuntimeError(
+                f"{method} {path} returned {response.status}: {response.body[:200]!r}")
+        return response.json()
+
+
+@dataclass
+class Fixture:
+    """Ids and tokens of the data created by `seed_via_api`."""
+    restaurant_id: str
+    admin_id: str
+    admin_token: str
+    customer_id: str
+    customer_token: str
+    customer_email: str
+    customer_password: str
+    menu_item_ids: list[str] = field(default_factory=list)
+    order_ids: list[str] = field(default_factory=list)
+
+
+async def register_and_login(client: ASGIClient, user_type: str, password: str):
+    email = f"{user_type}-{uuid.uuid4().hex[:12]}@example.com"
+    user = await client.expect("POST", "/register/", json_body={
+        "name": f"Seed {user_type}", "phone": "555-0100", "email": email,
+        "password": password, "user_type": user_type})
+    login = await client.expect("POST", "/login/", json_body={
+        "email": email, "password": password})
+    return user["id"], login["access_token"], email
+
+
+async def seed_via_api(client: ASGIClient, menu_items: int = 10, orders: int = 5) -> Fixture:
+    """Creates a restaurant, an admin, a customer, menu items and orders."""
+    password = "seed-password"
+    admin_id, admin_token, _ = await register_and_login(client, "admin", password)
+    customer_id, customer_token, customer_email = await register_and_login(
+        client, "customer", password)
+
+    restaurant = await client.expect("POST", "/restaurants/", token=admin_token, json_body={
+        "name": "Seed Kitchen", "phone": "555-0101", "address": "1 Main St",
+        "city": "Springfield", "state": "IL", "zip_code": "62701"})
+    fixture = Fixture(
+        restaurant_id=restaurant["id"], admin_id=admin_id, admin_token=admin_token,
+        customer_id=customer_id, customer_token=customer_token,
+        customer_email=customer_email, customer_password=password)
+
+    for i in range(menu_items):
+        item = await client.expect(
+            "POST", f"/restaurants/{fixture.restaurant_id}/menu_items/",
+            token=admin_token, json_body={
+                "name": f"Dish {i}", "price": 8 + i % 7,
+                "category": "drink" if i % 4 == 0 else "food"})
+        fixture.menu_item_ids.append(item["id"])
+
+    for i in range(orders):
+        order = await client.expect(
+            "POST", f"/restaurants/{fixture.restaurant_id}/users/{customer_id}/orders",
+            token=customer_token, json_body={
+                "name": f"Order {i}",
+                "order_items": [
+                    {"menu_item_id": fixture.menu_item_ids[(i + j) % menu_items],
+                     "quantity": 1 + j, "price": 8}
+                    for j in range(3)]})
+        fixture.order_ids.append(order["id"])
+
+    return fixture
+
+
+async def cleanup(client: ASGIClient, fixture: Fixture) -> None:
+    """Deletes the seeded restaurant (cascading to its data) and users."""
+    token = fixture.admin_token
+    await client.request("DELETE", f"/restaurants/{fixture.restaurant_id}", token=token)
+    await client.request("DELETE", f"/users/{fixture.customer_id}", token=token)
+    await client.request("DELETE", f"/users/{fixture.admin_id}", token=token)
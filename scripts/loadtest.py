@@ -0,0 +1,398 @@
+"""Load test a running server with a realistic request mix.
+
+Drives the API over real HTTP/1.1 connections, so the numbers include the
+uvicorn workers, the event loop, connection handling and the database pool
+as deployed. Point `--base-url` at a server started with
+`python -m backend.serve`, or pass `--serve` to start one for the run.
+
+The database must hold data from `scripts.generate_data` (same `--data-seed`).
+Restaurants are sampled in proportion to their order volume, so the hot
+ones get most of the traffic, and every virtual user keeps one keep-alive
+connection for the whole run. Each iteration picks a scenario by weight:
+
+    menu     a restaurant worker browses the menu and opens an item
+    orders   a customer places an order
+    kitchen  a restaurant worker polls pending orders and advances one
+    login    a customer logs in (bcrypt bound)
+
+Throughput and p50/p95/p99 latency are reported per endpoint and written as
+JSON, tagged with the current commit, so runs can be compared across commits.
+
+Usage:
+    python -m scripts.generate_data --preset medium --seed 42 --truncate
+    python -m scripts.loadtest --data-seed 42 --serve --duration 30 \\
+        --concurrency 50 --mix menu=50,orders=15,kitchen=30,login=5 \\
+        --output loadtest.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from backend.database import connect_asyncpg
+from scripts.generate_data import PASSWORD
+from scripts.harness import ASGIResponse
+
+SERVER_START_TIMEOUT = 30
+
+
+class HTTPConnection:
+    """A single keep-alive HTTP/1.1 connection, like one browser or screen.
+
+    Requests are sent one at a time. If the server closed the idle
+    connection, the request is retried once on a new connection.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, json_body=None,
+                      token: str | None = None) -> ASGIResponse:
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                f"Content-Length: {len(body)}"]
+        if json_body is not None:
+            head.append("Content-Type: application/json")
+        if token is not None:
+            head.append(f"Authorization: Bearer {token}")
+        message = ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+        for attempt in range(2):
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(
+                    self.host, self.port)
+            try:
+                self._writer.write(message)
+                await self._writer.drain()
+                status_line = await self._reader.readline()
+            except ConnectionError:
+                status_line = b""
+            if status_line:
+                return await self._read_response(status_line)
+            # Closed before answering: the server dropped an idle connection
+            await self.close()
+        raise ConnectionError(f"{method} {path}: connection closed by server")
+
+    async def _read_response(self, status_line: bytes) -> ASGIResponse:
+        status = int(status_line.split()[1])
+        headers = {}
+        while (line := await self._reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding") == "chunked":
+            chunks = []
+            while size := int((await self._reader.readline()).split(b";")[0], 16):
+                chunks.append(await self._reader.readexactly(size))
+                await self._reader.readline()
+            await self._reader.readline()
+            body = b"".join(chunks)
+        else:
+            body = await self._reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection") == "close":
+            await self.close()
+        return ASGIResponse(status, headers, body)
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        self._reader = self._writer = None
+
+
+class Recorder:
+    """Latencies and status codes per endpoint label.
+
+    409s are concurrent transitions of the same order, which the API rejects
+    by design, so they are counted as conflicts rather than errors.
+    """
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.conflicts = defaultdict(int)
+
+    async def call(self, client, label, method, path, **kwargs):
+        started = time.perf_counter()
+        response = await client.request(method, path, **kwargs)
+        self.latencies[label].append(time.perf_counter() - started)
+        if response.status == 409:
+            self.conflicts[label] += 1
+        elif response.status >= 400:
+            self.errors[label] += 1
+        return response
+
+    def summary(self, elapsed: float) -> dict:
+        results = {}
+        for label, samples in sorted(self.latencies.items()):
+            if len(samples) > 1:
+                cuts = statistics.quantiles(samples, n=100, method="inclusive")
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = samples[0]
+            results[label] = {
+                "requests": len(samples),
+                "errors": self.errors[label],
+                "conflicts": self.conflicts[label],
+                "throughput_rps": len(samples) / elapsed,
+                "p50_ms": p50 * 1000,
+                "p95_ms": p95 * 1000,
+                "p99_ms": p99 * 1000,
+            }
+        return results
+
+
+@dataclass
+class Dataset:
+    """Generated restaurants and users the virtual users act as."""
+    restaurant_ids: list[str]
+    restaurant_weights: list[int]
+    worker_tokens: dict[str, str]
+    menu_item_ids: dict[str, list[str]]
+    customers: list[dict] = field(default_factory=list)
+
+    def restaurant(self, rng: random.Random) -> str:
+        return rng.choices(self.restaurant_ids, self.restaurant_weights)[0]
+
+
+async def sample_dataset(client: HTTPConnection, restaurants: int, customers: int,
+                         data_seed: int, rng: random.Random) -> Dataset:
+    """Picks restaurants by order volume and customers at random, and logs them in."""
+    conn = await connect_asyncpg()
+    try:
+        volumes = await conn.fetch(
+            "SELECT restaurant_id, count(*) AS orders FROM orders GROUP BY restaurant_id")
+        # Weighted sampling without replacement (Efraimidis-Spirakis)
+        volumes = sorted(volumes, key=lambda row: rng.random() ** (1 / row["orders"]),
+                         reverse=True)[:restaurants]
+        restaurant_ids = [row["restaurant_id"] for row in volumes]
+        workers = await conn.fetch(
+            "SELECT DISTINCT ON (restaurant_id) restaurant_id, email FROM users "
+            "WHERE user_type = 'restaurant_worker' AND email LIKE $1 "
+            "AND restaurant_id = ANY($2::uuid[]) ORDER BY restaurant_id, email",
+            f"worker-{data_seed}-%", restaurant_ids)
+        menu_items = await conn.fetch(
+            "SELECT restaurant_id, id FROM menu_items "
+            "WHERE restaurant_id = ANY($1::uuid[]) AND available IS NOT FALSE",
+            restaurant_ids)
+        customer_rows = await conn.fetch(
+            "SELECT id, email FROM users WHERE user_type = 'customer' "
+            "AND email LIKE $1 ORDER BY random() LIMIT $2",
+            f"customer-{data_seed}-%", customers)
+    finally:
+        await conn.close()
+    if not workers or not customer_rows:
+        raise SystemExit(f"No generated data for --data-seed {data_seed}; "
+                         "run scripts.generate_data first")
+
+    async def log_in(email: str) -> str:
+        response = await client.request("POST", "/login/", json_body={
+            "email": email, "password": PASSWORD})
+        if response.status != 200:
+            raise SystemExit(f"Login as {email} returned {response.status}")
+        return response.json()["access_token"]
+
+    weights = {row["restaurant_id"]: row["orders"] for row in volumes}
+    dataset = Dataset(
+        restaurant_ids=[str(row["restaurant_id"]) for row in workers],
+        restaurant_weights=[weights[row["restaurant_id"]] for row in workers],
+        worker_tokens={str(row["restaurant_id"]): await log_in(row["email"])
+                       for row in workers},
+        menu_item_ids=defaultdict(list))
+    for row in menu_items:
+        dataset.menu_item_ids[str(row["restaurant_id"])].append(str(row["id"]))
+    for row in customer_rows:
+        dataset.customers.append({"id": str(row["id"]), "email": row["email"],
+                                  "token": await log_in(row["email"])})
+    return dataset
+
+
+async def browse_menu(client, recorder, dataset, rng):
+    r = dataset.restaurant(rng)
+    token = dataset.worker_tokens[r]
+    await recorder.call(client, "GET /menu_items/", "GET",
+                        f"/restaurants/{r}/menu_items/", token=token)
+    item = rng.choice(dataset.menu_item_ids[r])
+    await recorder.call(client, "GET /menu_items/{item_id}", "GET",
+                        f"/restaurants/{r}/menu_items/{item}", token=token)
+
+
+async def place_order(client, recorder, dataset, rng):
+    r = dataset.restaurant(rng)
+    customer = rng.choice(dataset.customers)
+    menu = dataset.menu_item_ids[r]
+    items = rng.sample(menu, k=min(rng.randint(1, 4), len(menu)))
+    await recorder.call(
+        client, "POST /users/{user_id}/orders", "POST",
+        f"/restaurants/{r}/users/{customer['id']}/orders", token=customer["token"],
+        json_body={"order_items": [
+            {"menu_item_id": item, "quantity": rng.randint(1, 3)} for item in items]})
+
+
+async def poll_kitchen(client, recorder, dataset, rng):
+    r = dataset.restaurant(rng)
+    token = dataset.worker_tokens[r]
+    response = await recorder.call(
+        client, "GET /status/{status}/orders", "GET",
+        f"/restaurants/{r}/status/pending/orders", token=token)
+    pending = response.json()["items"] if response.status == 200 else []
+    if pending:
+        order = rng.choice(pending)
+        await recorder.call(
+            client, "PUT /orders/{order_id}/next-status", "PUT",
+            f"/restaurants/{r}/users/{order['user_id']}/orders/{order['id']}/next-status"
+            f"?expected_status={order['status']}", token=token)
+
+
+async def login(client, recorder, dataset, rng):
+    customer = rng.choice(dataset.customers)
+    await recorder.call(client, "POST /login/", "POST", "/login/", json_body={
+        "email": customer["email"], "password": PASSWORD})
+
+
+SCENARIOS = {
+    "menu": browse_menu,
+    "orders": place_order,
+    "kitchen": poll_kitchen,
+    "login": login,
+}
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario '{name}', expected one of {list(SCENARIOS)}")
+        weights[name] = int(weight)
+    return weights
+
+
+def current_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def start_server(host: str, port: int) -> subprocess.Popen:
+    """Starts `python -m backend.serve` on host:port and waits until it answers."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "backend.serve"],
+        env={**os.environ, "WEB_HOST": host, "WEB_PORT": str(port)})
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit(f"Server exited with status {server.returncode}")
+        probe = HTTPConnection(host, port)
+        try:
+            await probe.request("GET", "/openapi.json")
+            return server
+        except OSError:
+            await asyncio.sleep(0.2)
+        finally:
+            await probe.close()
+    stop_server(server)
+    raise SystemExit(f"Server did not answer within {SERVER_START_TIMEOUT}s")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.send_signal(signal.SIGTERM)
+    server.wait()
+
+
+async def virtual_user(host, port, recorder, dataset, weights, deadline, rng):
+    names, scenario_weights = list(weights), list(weights.values())
+    client = HTTPConnection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            scenario = rng.choices(names, scenario_weights)[0]
+            await SCENARIOS[scenario](client, recorder, dataset, rng)
+    finally:
+        await client.close()
+
+
+async def main(args) -> None:
+    weights = parse_mix(args.mix)
+    url = urlsplit(args.base_url)
+    host, port = url.hostname, url.port or 80
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+
+    server = await start_server(host, port) if args.serve else None
+    try:
+        setup = HTTPConnection(host, port)
+        try:
+            dataset = await sample_dataset(
+                setup, args.restaurants, args.customers, args.data_seed, rng)
+        finally:
+            await setup.close()
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*[
+            virtual_user(host, port, recorder, dataset, weights, deadline,
+                         random.Random(args.seed + i))
+            for i in range(args.concurrency)])
+        elapsed = time.perf_counter() - started
+    finally:
+        if server is not None:
+            stop_server(server)
+
+    results = recorder.summary(elapsed)
+    print(f"{'endpoint':<36}{'reqs':>8}{'err':>6}{'409':>6}{'rps':>9}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for label, row in results.items():
+        print(f"{label:<36}{row['requests']:>8}{row['errors']:>6}{row['conflicts']:>6}"
+              f"{row['throughput_rps']:>9.1f}{row['p50_ms']:>9.2f}"
+              f"{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}")
+
+    report = {
+        "commit": current_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": vars(args),
+        "elapsed_seconds": elapsed,
+        "total_requests": sum(row["requests"] for row in results.values()),
+        "endpoints": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--serve", action="store_true",
+                        help="Start `python -m backend.serve` on --base-url for the run")
+    parser.add_argument("--data-seed", type=int, default=0,
+                        help="--seed the data was generated with")
+    parser.add_argument("--restaurants", type=int, default=50,
+                        help="Restaurants to sample, weighted by order volume")
+    parser.add_argument("--customers", type=int, default=50, help="Customers to log in as")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run")
+    parser.add_argument("--concurrency", type=int, default=20,
+                        help="Virtual users, one connection each")
+    parser.add_argument("--mix", default="menu=50,orders=15,kitchen=30,login=5")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="loadtest.json")
+    asyncio.run(main(parser.parse_args()))
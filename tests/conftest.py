@@ -0,0 +1,49 @@
+"""Shared fixtures.
+
+Unit tests run without any service. Tests that use the `database` fixture
+call the app against the Postgres in DATABASE_URL, which should be migrated
+to head, and are skipped when no DATABASE_URL is configured.
+"""
+import os
+
+import pytest
+from dotenv import dotenv_values
+
+# backend.config reads the same variables, from the environment first
+DATABASE_URL = os.environ.get("DATABASE_URL") or dotenv_values(".env").get("DATABASE_URL")
+if not DATABASE_URL:
+    # Settings require a URL even for modules that never connect
+    os.environ["DATABASE_URL"] = "postgresql+asyncpg://localhost/unconfigured"
+os.environ.setdefault("SECRET_KEY", "test-secret-key-not-for-production")
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def database(anyio_backend):
+    """The app's engine, shared by every database test of the session."""
+    if not DATABASE_URL:
+        pytest.skip("DATABASE_URL is not configured")
+    from backend.database import engine
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def client(database):
+    """In-process client for backend.main:app."""
+    from backend.main import app
+    from scripts.harness import ASGIClient
+    return ASGIClient(app)
+
+
+@pytest.fixture
+async def seeded(client):
+    """A restaurant with menu items, orders, an admin and a customer."""
+    from scripts.harness import cleanup, seed_via_api
+    fixture = await seed_via_api(client)
+    yield fixture
+    await cleanup(client, fixture)
@@ -0,0 +1,61 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api.analytics import MAX_BUCKETS, RollupRange
+
+pytestmark = pytest.mark.anyio
+
+
+def test_bounds_with_an_offset_are_converted_to_utc():
+    buckets = RollupRange(
+        start=datetime(2026, 3, 1, 2, tzinfo=timezone(timedelta(hours=2))),
+        end=datetime(2026, 3, 2), granularity="hour")
+    assert buckets.start == datetime(2026, 3, 1, 0)
+    assert buckets.end == datetime(2026, 3, 2)
+
+
+@pytest.mark.parametrize("start, end, granularity", [
+    (datetime(2026, 3, 2), datetime(2026, 3, 2), "day"),
+    (datetime(2026, 3, 2), datetime(2026, 3, 1), "day"),
+    (datetime(2026, 1, 1), datetime(2026, 1, 1) + timedelta(hours=MAX_BUCKETS + 1), "hour"),
+])
+def test_invalid_ranges_are_rejected(start, end, granularity):
+    with pytest.raises(HTTPException) as error:
+        RollupRange(start=start, end=end, granularity=granularity)
+    assert error.value.status_code == 400
+
+
+@pytest.fixture
+def local_time_zone():
+    """Runs the test with the process in a time zone far from UTC."""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "Pacific/Kiritimati"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+async def test_completed_order_is_bucketed_by_its_utc_hour(local_time_zone, client, seeded):
+    r, c, admin = seeded.restaurant_id, seeded.customer_id, seeded.admin_token
+    for status in ("pending", "preparing", "ready"):
+        await client.expect(
+            "PUT", f"/restaurants/{r}/users/{c}/orders/{seeded.order_ids[0]}"
+            f"/next-status?expected_status={status}", token=admin)
+
+    hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    sales = await client.expect(
+        "GET", f"/restaurants/{r}/analytics/sales?granularity=hour"
+        f"&start={hour.isoformat()}Z&end={(hour + timedelta(hours=1)).isoformat()}Z",
+        token=admin)
+    # Seeded order 0 has 1, 2 and 3 of the menu items priced 8, 9 and 10
+    assert [(bucket["bucket_start"], bucket["order_count"], Decimal(bucket["revenue"]))
+            for bucket in sales] == [(hour.isoformat(), 1, Decimal("56.00"))]
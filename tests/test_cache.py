@@ -0,0 +1,85 @@
+import uuid
+
+import pytest
+
+from backend import cache
+from backend.cache import MenuCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_hit_and_miss():
+    menus = MenuCache(max_entries=4)
+    restaurant = uuid.uuid4()
+    assert menus.get(restaurant, ("page", 1)) is None
+    menus.put(restaurant, ("page", 1), "menu", menus.version(restaurant))
+    assert menus.get(restaurant, ("page", 1)) == "menu"
+    assert (menus.hits, menus.misses) == (1, 1)
+
+
+def test_entries_expire_after_the_ttl(clock):
+    menus = MenuCache(max_entries=4, ttl=30)
+    restaurant = uuid.uuid4()
+    menus.put(restaurant, ("page", 1), "menu", 0)
+
+    clock[0] += 29.9
+    assert menus.get(restaurant, ("page", 1)) == "menu"
+    clock[0] += 0.1
+    assert menus.get(restaurant, ("page", 1)) is None
+    assert menus.stats()["expirations"] == 1
+    assert menus.stats()["entries"] == 0
+
+
+def test_ttl_zero_never_expires(clock):
+    menus = MenuCache(max_entries=4)
+    restaurant = uuid.uuid4()
+    menus.put(restaurant, ("page", 1), "menu", 0)
+    clock[0] += 10 ** 9
+    assert menus.get(restaurant, ("page", 1)) == "menu"
+
+
+def test_least_recently_used_entry_is_evicted():
+    menus = MenuCache(max_entries=2)
+    restaurant = uuid.uuid4()
+    for page in (1, 2):
+        menus.put(restaurant, ("page", page), page, 0)
+    menus.get(restaurant, ("page", 1))
+    menus.put(restaurant, ("page", 3), 3, 0)
+
+    assert menus.get(restaurant, ("page", 2)) is None
+    assert menus.get(restaurant, ("page", 1)) == 1
+    assert menus.get(restaurant, ("page", 3)) == 3
+    assert menus.evictions == 1
+
+
+def test_invalidate_drops_only_that_restaurants_pages():
+    menus = MenuCache(max_entries=4)
+    restaurant, other = uuid.uuid4(), uuid.uuid4()
+    menus.put(restaurant, ("page", 1), "menu", 0)
+    menus.put(other, ("page", 1), "other menu", 0)
+
+    menus.invalidate(restaurant)
+    assert menus.get(restaurant, ("page", 1)) is None
+    assert menus.get(other, ("page", 1)) == "other menu"
+    assert menus.version(restaurant) == 1
+
+
+def test_page_read_before_a_write_is_not_stored():
+    menus = MenuCache(max_entries=4)
+    restaurant = uuid.uuid4()
+    version = menus.version(restaurant)
+    menus.invalidate(restaurant)
+    menus.put(restaurant, ("page", 1), "stale menu", version)
+    assert menus.get(restaurant, ("page", 1)) is None
+
+
+def test_size_zero_disables_the_cache():
+    menus = MenuCache(max_entries=0)
+    restaurant = uuid.uuid4()
+    menus.put(restaurant, ("page", 1), "menu", 0)
+    assert menus.get(restaurant, ("page", 1)) is None
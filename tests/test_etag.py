@@ -0,0 +1,36 @@
+import pytest
+from fastapi import Request, Response
+
+from backend.etag import conditional_response, etag_matches
+
+ETAG = '"0123abcd"'
+
+
+def request_with(if_none_match: str | None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize("header, matches", [
+    (None, False),
+    ("", False),
+    (ETAG, True),
+    (f"W/{ETAG}", True),
+    (f'"other", {ETAG}', True),
+    (f'W/"other",W/{ETAG}', True),
+    ('"other", W/"more"', False),
+    ("*", True),
+    (ETAG.upper(), False),
+])
+def test_etag_matches(header, matches):
+    assert etag_matches(request_with(header), ETAG) is matches
+
+
+def test_conditional_response():
+    response = Response()
+    assert conditional_response(request_with('"other"'), response, ETAG) is None
+    assert response.headers["ETag"] == ETAG
+
+    not_modified = conditional_response(request_with(ETAG), Response(), ETAG)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == ETAG
@@ -0,0 +1,25 @@
+import logging
+
+from backend import logger as logger_module
+from backend.logger import SamplingFilter
+
+
+def record(level: int) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 1, "message", None, None)
+
+
+def test_sampling_keeps_the_configured_share(monkeypatch):
+    sampling = SamplingFilter({"info": 0.25, "DEBUG": 0})
+
+    monkeypatch.setattr(logger_module.random, "random", lambda: 0.2)
+    assert sampling.filter(record(logging.INFO))
+    monkeypatch.setattr(logger_module.random, "random", lambda: 0.3)
+    assert not sampling.filter(record(logging.INFO))
+    assert not sampling.filter(record(logging.DEBUG))
+
+
+def test_levels_without_a_rate_are_kept(monkeypatch):
+    monkeypatch.setattr(logger_module.random, "random", lambda: 0.99)
+    sampling = SamplingFilter({"INFO": 0.1})
+    assert sampling.filter(record(logging.WARNING))
+    assert sampling.filter(record(logging.ERROR))
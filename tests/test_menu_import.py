@@ -0,0 +1,71 @@
+import pytest
+
+from backend.menu_import import (
+    LineTooLong, iter_lines, iter_records, validate_record
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def lines_of(*chunks: bytes, **kwargs) -> list[str]:
+    return [line async for line in iter_lines(stream(*chunks), **kwargs)]
+
+
+async def records_of(body: bytes, content_type: str) -> list:
+    return [record async for record in iter_records(iter_lines(stream(body)), content_type)]
+
+
+async def test_lines_split_across_chunks():
+    assert await lines_of(b"\xef\xbb\xbfa,b\r\nc", b"af\xc3", b"\xa9\nlast") == \
+        ["a,b", "café", "last"]
+
+
+async def test_line_longer_than_the_maximum_is_rejected():
+    with pytest.raises(LineTooLong, match="line 2"):
+        await lines_of(b"short\n", b"x" * 11 + b"\n", max_length=10)
+
+
+async def test_unterminated_line_is_rejected_before_the_body_ends():
+    chunks = iter([b"x" * 6, b"x" * 6])
+
+    async def endless():
+        for chunk in chunks:
+            yield chunk
+        raise AssertionError("read past the limit")
+
+    with pytest.raises(LineTooLong, match="line 1"):
+        async for _ in iter_lines(endless(), max_length=10):
+            pass
+
+
+async def test_line_at_the_maximum_is_kept():
+    assert await lines_of(b"x" * 10 + b"\r\n", max_length=10) == ["x" * 10]
+
+
+async def test_csv_records_follow_the_header():
+    body = b"name,price,category\n\nSoup,4.5,food\nTea,2\n"
+    assert await records_of(body, "text/csv") == [
+        (3, {"name": "Soup", "price": "4.5", "category": "food"}, None),
+        (4, None, "expected 3 columns, got 2"),
+    ]
+
+
+async def test_ndjson_records_must_be_objects():
+    body = b'{"name": "Soup"}\n[1]\n{broken\n'
+    records = await records_of(body, "application/x-ndjson")
+    assert records[0] == (1, {"name": "Soup"}, None)
+    assert records[1] == (2, None, "expected a JSON object")
+    assert records[2][0] == 3 and records[2][1] is None and records[2][2]
+
+
+def test_validate_record():
+    item, error = validate_record({"name": "Soup", "price": "4.5", "category": "food"})
+    assert error is None and item.name == "Soup"
+
+    item, error = validate_record({"name": "Soup", "category": "food"})
+    assert item is None and error.startswith("price: ")
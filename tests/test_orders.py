@@ -0,0 +1,29 @@
+import uuid
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import update
+
+from backend.models.order_items import OrderItem
+from backend.schemas.order_items import OrderItemCreate
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("quantity", [0, -1])
+def test_new_order_items_need_a_positive_quantity(quantity):
+    with pytest.raises(ValidationError):
+        OrderItemCreate(menu_item_id=uuid.uuid4(), quantity=quantity)
+
+
+async def test_stored_items_are_read_whatever_their_quantity(database, client, seeded):
+    r, c, order = seeded.restaurant_id, seeded.customer_id, seeded.order_ids[0]
+    # Rows written before quantities were validated
+    async with database.begin() as conn:
+        await conn.execute(update(OrderItem)
+                           .where(OrderItem.order_id == uuid.UUID(order))
+                           .values(quantity=0))
+
+    items = await client.expect(
+        "GET", f"/restaurants/{r}/users/{c}/orders/{order}/items", token=seeded.admin_token)
+    assert [item["quantity"] for item in items] == [0, 0, 0]
@@ -0,0 +1,36 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from backend.pagination import decode_cursor, encode_cursor
+
+
+def cursor_of(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def test_cursor_round_trip():
+    created_at, id = datetime(2026, 3, 1, 12, 30, 15, 123456), uuid.uuid4()
+    assert decode_cursor(encode_cursor(created_at, id)) == (created_at, id)
+
+
+@pytest.mark.parametrize("cursor", [
+    pytest.param("not base64!", id="bad base64"),
+    pytest.param(base64.urlsafe_b64encode(b"\xff\xfe").decode(), id="not utf-8"),
+    pytest.param(base64.urlsafe_b64encode(b"[1,").decode(), id="bad json"),
+    pytest.param(cursor_of({"created_at": "2020-01-01"}), id="not a list"),
+    pytest.param(cursor_of(["2020-01-01"]), id="too short"),
+    pytest.param(cursor_of(["2020-01-01", str(uuid.uuid4()), 1]), id="too long"),
+    pytest.param(cursor_of(["2020-01-01", 5]), id="id not a string"),
+    pytest.param(cursor_of([None, str(uuid.uuid4())]), id="created_at not a string"),
+    pytest.param(cursor_of(["yesterday", str(uuid.uuid4())]), id="bad timestamp"),
+    pytest.param(cursor_of(["2020-01-01", "not-a-uuid"]), id="bad uuid"),
+])
+def test_malformed_cursor_is_a_bad_request(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
@@ -0,0 +1,321 @@
+"""Every endpoint must stay within a declared SQL statement and row budget.
+
+Each test seeds a small dataset through the API and calls routes of
+backend.main:app in process against the database in DATABASE_URL. The
+statement count of each call comes from the engine events behind /metrics;
+rows are the number of records in the response. Exceeding a budget, or adding
+a route without one, fails, so N+1 queries and accidental eager joins are
+caught before they ship.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.routing import APIRoute
+
+from backend.main import app
+from backend.metrics import metrics
+from scripts.harness import ASGIClient, Fixture
+
+pytestmark = pytest.mark.anyio
+
+# (method, route) -> (max SQL statements, max rows in the response)
+BUDGETS = {
+    ("GET", "/restaurants/"): (1, 50),
+    ("GET", "/restaurants/{restaurant_id}"): (1, 1),
+    ("POST", "/restaurants/"): (2, 1),
+    ("PUT", "/restaurants/{restaurant_id}"): (3, 1),
+    ("DELETE", "/restaurants/{restaurant_id}"): (2, 1),
+    ("GET", "/restaurants/{restaurant_id}/menu_items/"): (1, 50),
+    ("GET", "/restaurants/{restaurant_id}/menu_items/{item_id}"): (1, 1),
+    ("POST", "/restaurants/{restaurant_id}/menu_items/"): (2, 1),
+    ("POST", "/restaurants/{restaurant_id}/menu_items/import"): (1, 1),
+    ("PUT", "/restaurants/{restaurant_id}/menu_items/{item_id}"): (3, 1),
+    ("DELETE", "/restaurants/{restaurant_id}/menu_items/{item_id}"): (2, 1),
+    ("GET", "/users/"): (1, 50),
+    ("GET", "/users/export"): (1, 10_000),
+    ("GET", "/users/current_user"): (1, 1),
+    ("GET", "/users/{user_id}"): (1, 1),
+    ("GET", "/users/type/{user_type}"): (1, 50),
+    ("POST", "/register/"): (2, 1),
+    ("POST", "/login/"): (1, 1),
+    ("PUT", "/users/{user_id}/password"): (2, 1),
+    ("PUT", "/users/{user_id}"): (3, 1),
+    ("DELETE", "/users/{user_id}"): (2, 1),
+    ("GET", "/restaurants/{restaurant_id}/orders"): (1, 50),
+    ("GET", "/restaurants/{restaurant_id}/orders/export"): (1, 100),
+    ("GET", "/restaurants/{restaurant_id}/users/{user_id}/orders"): (1, 50),
+    ("GET", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}"): (1, 1),
+    ("GET", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/items"): (1, 10),
+    ("GET", "/restaurants/{restaurant_id}/status/{status}/orders"): (1, 50),
+    ("PUT", "/restaurants/{restaurant_id}/orders/status"): (2, 1),
+    ("POST", "/restaurants/{restaurant_id}/users/{user_id}/orders"): (4, 1),
+    ("PUT", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}"): (3, 1),
+    ("PUT", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/next-status"): (2, 1),
+    ("PUT", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/cancel"): (2, 1),
+    ("DELETE", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}"): (2, 1),
+    ("GET", "/restaurants/{restaurant_id}/analytics/sales"): (1, 1000),
+    ("GET", "/restaurants/{restaurant_id}/analytics/top-items"): (1, 100),
+    ("GET", "/admin/cache/menu"): (0, 1),
+    ("GET", "/admin/security/password-hashing"): (0, 1),
+    ("GET", "/admin/db/pool"): (0, 1),
+    ("GET", "/metrics"): (0, 1),
+}
+
+# Transitions that complete orders add them to the hourly and daily rollups:
+# one upsert per rollup table and granularity
+COMPLETION_BUDGETS = {
+    ("PUT", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/next-status"): (6, 1),
+    ("PUT", "/restaurants/{restaurant_id}/orders/status"): (6, 1),
+}
+
+# Event streams never finish, so they cannot be called like other routes
+UNCHECKED = {
+    ("GET", "/restaurants/{restaurant_id}/orders/events"),
+    ("GET", "/restaurants/{restaurant_id}/users/{user_id}/orders/events"),
+}
+
+
+def count_rows(response) -> int:
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith("application/x-ndjson"):
+        return response.body.count(b"\n")
+    if not content_type.startswith("application/json"):
+        return 1
+    data = response.json()
+    if isinstance(data, dict) and "items" in data:
+        return len(data["items"])
+    if isinstance(data, list):
+        return len(data)
+    return 1
+
+
+def calls(f):
+    """(method, route, filled path, request kwargs) in a dependency-safe order."""
+    r, c, admin, customer = f.restaurant_id, f.customer_id, f.admin_token, f.customer_token
+    item, order = f.menu_item_ids[0], f.order_ids[0]
+    today = datetime.now(timezone.utc).date()
+    week = f"start={today - timedelta(days=6)}&end={today + timedelta(days=1)}"
+    new_order = {"order_items": [
+        {"menu_item_id": item, "quantity": 1, "price": 8}]}
+    return [
+        ("GET", "/restaurants/", "/restaurants/", {"token": admin}),
+        ("GET", "/restaurants/{restaurant_id}", f"/restaurants/{r}", {"token": admin}),
+        ("PUT", "/restaurants/{restaurant_id}", f"/restaurants/{r}",
+         {"token": admin, "json_body": {"description": "Budget check"}}),
+        ("GET", "/restaurants/{restaurant_id}/menu_items/",
+         f"/restaurants/{r}/menu_items/", {"token": admin}),
+        ("GET", "/restaurants/{restaurant_id}/menu_items/{item_id}",
+         f"/restaurants/{r}/menu_items/{item}", {"token": admin}),
+        ("POST", "/restaurants/{restaurant_id}/menu_items/",
+         f"/restaurants/{r}/menu_items/",
+         {"token": admin, "json_body": {"name": "Extra", "price": 3, "category": "food"}}),
+        ("POST", "/restaurants/{restaurant_id}/menu_items/import",
+         f"/restaurants/{r}/menu_items/import",
+         {"token": admin, "headers": {"content-type": "text/csv"},
+          "body": b"name,price,category\nImported,4.5,food\n"}),
+        ("PUT", "/restaurants/{restaurant_id}/menu_items/{item_id}",
+         f"/restaurants/{r}/menu_items/{f.menu_item_ids[-1]}",
+         {"token": admin, "json_body": {"available": False}}),
+        ("GET", "/users/", "/users/", {"token": admin}),
+        ("GET", "/users/export", "/users/export", {"token": admin}),
+        ("GET", "/users/current_user", "/users/current_user", {"token": customer}),
+        ("GET", "/users/{user_id}", f"/users/{c}", {"token": admin}),
+        ("GET", "/users/type/{user_type}", "/users/type/customer", {"token": admin}),
+        ("POST", "/login/", "/login/",
+         {"json_body": {"email": f.customer_email, "password": f.customer_password}}),
+        ("PUT", "/users/{user_id}/password", f"/users/{c}/password",
+         {"token": customer, "json_body": {"old_password": f.customer_password,
+                                           "new_password": f.customer_password}}),
+        ("PUT", "/users/{user_id}", f"/users/{c}",
+         {"token": admin, "json_body": {"city": "Shelbyville", "phone": "555-0102"}}),
+        ("GET", "/restaurants/{restaurant_id}/orders",
+         f"/restaurants/{r}/orders", {"token": admin}),
+        ("GET", "/restaurants/{restaurant_id}/orders/export",
+         f"/restaurants/{r}/orders/export", {"token": admin}),
+        ("GET", "/restaurants/{restaurant_id}/users/{user_id}/orders",
+         f"/restaurants/{r}/users/{c}/orders", {"token": customer}),
+        ("GET", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}",
+         f"/restaurants/{r}/users/{c}/orders/{order}", {"token": customer}),
+        ("GET", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/items",
+         f"/restaurants/{r}/users/{c}/orders/{order}/items", {"token": customer}),
+        ("GET", "/restaurants/{restaurant_id}/status/{status}/orders",
+         f"/restaurants/{r}/status/pending/orders", {"token": admin}),
+        ("POST", "/restaurants/{restaurant_id}/users/{user_id}/orders",
+         f"/restaurants/{r}/users/{c}/orders", {"token": customer, "json_body": new_order}),
+        ("PUT", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}",
+         f"/restaurants/{r}/users/{c}/orders/{order}",
+         {"token": admin, "json_body": {"name": "Renamed"}}),
+        ("PUT", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/next-status",
+         f"/restaurants/{r}/users/{c}/orders/{order}/next-status?expected_status=pending",
+         {"token": admin}),
+        ("PUT", "/restaurants/{restaurant_id}/orders/status",
+         f"/restaurants/{r}/orders/status",
+         {"token": admin, "json_body": {"order_ids": f.order_ids[1:], "action": "advance"}}),
+        ("PUT", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/cancel",
+         f"/restaurants/{r}/users/{c}/orders/{f.order_ids[1]}/cancel?expected_status=preparing",
+         {"token": admin}),
+        ("DELETE", "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}",
+         f"/restaurants/{r}/users/{c}/orders/{f.order_ids[-1]}", {"token": admin}),
+        ("DELETE", "/restaurants/{restaurant_id}/menu_items/{item_id}",
+         f"/restaurants/{r}/menu_items/{f.menu_item_ids[-1]}", {"token": admin}),
+        ("GET", "/restaurants/{restaurant_id}/analytics/sales",
+         f"/restaurants/{r}/analytics/sales?{week}&granularity=hour", {"token": admin}),
+        ("GET", "/restaurants/{restaurant_id}/analytics/top-items",
+         f"/restaurants/{r}/analytics/top-items?{week}", {"token": admin}),
+        ("GET", "/admin/cache/menu", "/admin/cache/menu", {"token": admin}),
+        ("GET", "/admin/security/password-hashing",
+         "/admin/security/password-hashing", {"token": admin}),
+        ("GET", "/admin/db/pool", "/admin/db/pool", {"token": admin}),
+        ("GET", "/metrics", "/metrics", {"token": admin}),
+    ]
+
+
+# Routes exercised by test_routes_within_budget outside of `calls`, because
+# each creates what the next call deletes
+CREATED_AND_DELETED = {
+    ("POST", "/register/"), ("DELETE", "/users/{user_id}"),
+    ("POST", "/restaurants/"), ("DELETE", "/restaurants/{restaurant_id}"),
+}
+
+
+async def measure(client: ASGIClient, method: str, route: str, path: str,
+                  budget: tuple[int, int] | None = None, **kwargs):
+    """Calls one route and returns (overrun, response).
+
+    `overrun` describes the failed status or exceeded budget, or is None.
+    """
+    before = sum(metrics.db_statements.values())
+    response = await client.request(method, path, **kwargs)
+    statements = sum(metrics.db_statements.values()) - before
+    rows = count_rows(response)
+    max_statements, max_rows = budget or BUDGETS[(method, route)]
+
+    if response.status < 400 and statements <= max_statements and rows <= max_rows:
+        return None, response
+    return (f"{method} {route}: status={response.status} "
+            f"statements={statements}/{max_statements} rows={rows}/{max_rows}"), response
+
+
+def test_every_route_has_a_budget():
+    placeholders = Fixture("r", "a", "t", "c", "t", "e", "p",
+                           menu_item_ids=["m"] * 10, order_ids=["o"] * 5)
+    exercised = {(method, route) for method, route, _, _ in calls(placeholders)}
+    exercised |= CREATED_AND_DELETED
+
+    problems = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        for method in route.methods:
+            key = (method, route.path)
+            if key in UNCHECKED:
+                continue
+            if key not in BUDGETS:
+                problems.append(f"{method} {route.path}: no budget declared")
+            elif key not in exercised:
+                problems.append(f"{method} {route.path}: not exercised")
+    assert problems == []
+
+
+async def test_routes_within_budget(client, seeded):
+    overruns = []
+    for method, route, path, kwargs in calls(seeded):
+        overrun, _ = await measure(client, method, route, path, **kwargs)
+        overruns.append(overrun)
+
+    overrun, response = await measure(
+        client, "POST", "/register/", "/register/", json_body={
+            "name": "Budget", "phone": "555-0103",
+            "email": f"budget-{seeded.admin_id}@example.com",
+            "password": "budget-password", "user_type": "customer"})
+    overruns.append(overrun)
+    overrun, _ = await measure(
+        client, "DELETE", "/users/{user_id}", f"/users/{response.json()['id']}",
+        token=seeded.admin_token)
+    overruns.append(overrun)
+
+    overrun, response = await measure(
+        client, "POST", "/restaurants/", "/restaurants/", token=seeded.admin_token,
+        json_body={"name": "Budget", "phone": "555-0104", "address": "2 Main St",
+                   "city": "Springfield", "state": "IL", "zip_code": "62701"})
+    overruns.append(overrun)
+    overrun, _ = await measure(
+        client, "DELETE", "/restaurants/{restaurant_id}",
+        f"/restaurants/{response.json()['id']}", token=seeded.admin_token)
+    overruns.append(overrun)
+
+    assert [overrun for overrun in overruns if overrun] == []
+
+
+async def advance(client: ASGIClient, f: Fixture, order_id: str, *statuses: str) -> None:
+    """Moves an order through next-status once from each of `statuses`."""
+    for status in statuses:
+        await client.expect(
+            "PUT", f"/restaurants/{f.restaurant_id}/users/{f.customer_id}/orders/"
+            f"{order_id}/next-status?expected_status={status}", token=f.admin_token)
+
+
+async def test_completions_within_budget(client, seeded):
+    r, c, admin = seeded.restaurant_id, seeded.customer_id, seeded.admin_token
+    next_status = "/restaurants/{restaurant_id}/users/{user_id}/orders/{order_id}/next-status"
+    bulk = "/restaurants/{restaurant_id}/orders/status"
+    order, bulk_ids = seeded.order_ids[0], seeded.order_ids[2:4]
+
+    await advance(client, seeded, order, "pending", "preparing")
+    for _ in range(2):
+        await client.expect("PUT", f"/restaurants/{r}/orders/status", token=admin,
+                            json_body={"order_ids": bulk_ids, "action": "advance"})
+
+    overrun, _ = await measure(
+        client, "PUT", next_status,
+        f"/restaurants/{r}/users/{c}/orders/{order}/next-status?expected_status=ready",
+        budget=COMPLETION_BUDGETS[("PUT", next_status)], token=admin)
+    assert overrun is None
+    overrun, _ = await measure(
+        client, "PUT", bulk, f"/restaurants/{r}/orders/status",
+        budget=COMPLETION_BUDGETS[("PUT", bulk)], token=admin,
+        json_body={"order_ids": bulk_ids, "action": "advance"})
+    assert overrun is None
+
+
+async def test_deleting_a_menu_item_keeps_order_history(client, seeded):
+    r, c, admin = seeded.restaurant_id, seeded.customer_id, seeded.admin_token
+    # Seeded order 2 has lines for menu items 2, 3 and 4
+    await advance(client, seeded, seeded.order_ids[2], "pending", "preparing", "ready")
+    order_path = f"/restaurants/{r}/users/{c}/orders/{seeded.order_ids[2]}"
+    deleted_id = seeded.menu_item_ids[2]
+    today = datetime.now(timezone.utc).date()
+    top_items_path = (f"/restaurants/{r}/analytics/top-items"
+                      f"?start={today - timedelta(days=1)}&end={today + timedelta(days=1)}")
+    order_before = await client.expect("GET", order_path, token=admin)
+    items_before = await client.expect("GET", f"{order_path}/items", token=admin)
+    top_items_before = await client.expect("GET", top_items_path, token=admin)
+
+    await client.expect("DELETE", f"/restaurants/{r}/menu_items/{deleted_id}", token=admin)
+    order_after = await client.expect("GET", order_path, token=admin)
+    items_after = await client.expect("GET", f"{order_path}/items", token=admin)
+    top_items_after = await client.expect("GET", top_items_path, token=admin)
+
+    assert order_after == order_before
+    expected_items = [
+        {**item, "menu_item_id": None if item["menu_item_id"] == deleted_id
+         else item["menu_item_id"]}
+        for item in items_before]
+    assert sorted(items_after, key=lambda item: item["id"]) == \
+        sorted(expected_items, key=lambda item: item["id"])
+
+    assert deleted_id in {item["menu_item_id"] for item in top_items_before}
+    assert top_items_after == [
+        {**item, "name": None if item["menu_item_id"] == deleted_id else item["name"]}
+        for item in top_items_before]
+
+
+async def test_deleting_a_restaurant_drops_its_cached_menu(client, seeded):
+    menu_path = f"/restaurants/{seeded.restaurant_id}/menu_items/"
+    menu = await client.expect("GET", menu_path, token=seeded.admin_token)
+    assert menu["items"]
+
+    await client.expect("DELETE", f"/restaurants/{seeded.restaurant_id}",
+                        token=seeded.admin_token)
+    menu = await client.expect("GET", menu_path, token=seeded.admin_token)
+    assert menu["items"] == []
@@ -0,0 +1,97 @@
+"""Every hot router query must be served by an index.
+
+Each query is run through EXPLAIN with sequential scans disabled for the
+session. If the planner still picks a Seq Scan, no usable index exists for
+that access path. Because seq scans are disabled, the result does not depend
+on table sizes or statistics, so an empty database works as well as a seeded
+one.
+"""
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from backend.models.menu_items import MenuItem
+from backend.models.order_items import OrderItem
+from backend.models.order_rollups import OrderRollup
+from backend.models.orders import Order
+from backend.models.restaurants import Restaurant
+from backend.models.sales_rollups import SalesRollup
+from backend.models.users import User
+
+pytestmark = pytest.mark.anyio
+
+
+def hot_queries():
+    """Queries issued by the routers, keyed by a readable name."""
+    restaurant_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    order_id = uuid.uuid4()
+
+    return {
+        "get_orders (restaurant)": select(Order)
+        .where(Order.restaurant_id == restaurant_id)
+        .order_by(Order.created_at, Order.id),
+        "get_orders (user)": select(Order)
+        .where(Order.restaurant_id == restaurant_id)
+        .where(Order.user_id == user_id)
+        .order_by(Order.created_at, Order.id),
+        "get_orders_by_status": select(Order)
+        .where(Order.restaurant_id == restaurant_id)
+        .where(Order.status == "pending")
+        .order_by(Order.created_at, Order.id),
+        "get_order items": select(OrderItem)
+        .where(OrderItem.order_id == order_id),
+        "get_menu": select(MenuItem)
+        .where(MenuItem.restaurant_id == restaurant_id)
+        .order_by(MenuItem.created_at, MenuItem.id),
+        "get_restaurants": select(Restaurant)
+        .order_by(Restaurant.created_at, Restaurant.id),
+        "get_users": select(User)
+        .order_by(User.created_at, User.id),
+        "get_users_by_type": select(User)
+        .where(User.user_type == "customer")
+        .order_by(User.created_at, User.id),
+        "login": select(User).where(User.email == "someone@example.com"),
+        "get_sales": select(OrderRollup)
+        .where(OrderRollup.restaurant_id == restaurant_id)
+        .where(OrderRollup.granularity == "day")
+        .where(OrderRollup.bucket_start >= datetime(2026, 1, 1))
+        .order_by(OrderRollup.bucket_start),
+        "get_top_items": select(SalesRollup)
+        .where(SalesRollup.restaurant_id == restaurant_id)
+        .where(SalesRollup.granularity == "day")
+        .where(SalesRollup.bucket_start >= datetime(2026, 1, 1)),
+    }
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Return the relations read by a Seq Scan anywhere in the plan tree."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def test_seq_scans_walks_the_plan_tree():
+    plan = {"Node Type": "Nested Loop", "Plans": [
+        {"Node Type": "Index Scan", "Relation Name": "orders"},
+        {"Node Type": "Seq Scan", "Relation Name": "order_items"}]}
+    assert seq_scans(plan) == ["order_items"]
+
+
+@pytest.mark.parametrize("name, query", hot_queries().items(), ids=list(hot_queries()))
+async def test_hot_query_uses_an_index(database, name, query):
+    sql = str(query.compile(
+        dialect=postgresql.asyncpg.dialect(), compile_kwargs={"literal_binds": True}))
+    async with database.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        plan = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    assert seq_scans(plan[0]["Plan"]) == []
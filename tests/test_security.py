@@ -0,0 +1,81 @@
+import pytest
+
+from backend import security
+from backend.config import settings
+from backend.main import app
+from backend.security import PUBLIC_PATHS, TokenCache, create_access_token
+from scripts.harness import ASGIClient
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("path, public", [
+    ("/docs", True),
+    ("/openapi.json", True),
+    ("/login/", True),
+    ("/register", True),
+    ("/metrics", True),
+    ("/metrics/", False),
+    ("/metricsx", False),
+    ("/login/../users/", False),
+    ("/docs-private", False),
+    ("/users/", False),
+])
+def test_public_paths_match_whole_paths(path, public):
+    assert bool(PUBLIC_PATHS.fullmatch(path)) is public
+
+
+@pytest.mark.parametrize("user_type, status", [(None, 401), ("customer", 403), ("admin", 200)])
+async def test_metrics_needs_an_admin(monkeypatch, user_type, status):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+    token = user_type and create_access_token({"sub": "someone", "user_type": user_type})
+    response = await ASGIClient(app).request("GET", "/metrics", token=token)
+    assert response.status == status
+
+
+@pytest.mark.parametrize("token, status", [("scrape-secret", 200), ("scrape-secreT", 401)])
+async def test_metrics_accepts_the_scrape_token(monkeypatch, token, status):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    response = await ASGIClient(app).request("GET", "/metrics", token=token)
+    assert response.status == status
+
+
+def test_token_cache_entries_expire_with_the_token(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(security.time, "time", lambda: now[0])
+    tokens = TokenCache(max_entries=4)
+    tokens.put("token", {"sub": "someone", "exp": now[0] + 60})
+
+    assert tokens.get("token") == {"sub": "someone", "exp": now[0] + 60}
+    now[0] += 60
+    assert tokens.get("token") is None
+
+
+def test_token_cache_skips_tokens_without_expiry():
+    tokens = TokenCache(max_entries=4)
+    tokens.put("token", {"sub": "someone"})
+    assert tokens.get("token") is None
+
+
+def test_token_cache_evicts_the_least_recently_used_token():
+    tokens = TokenCache(max_entries=2)
+    far_future = 2 ** 40
+    for token in ("a", "b"):
+        tokens.put(token, {"sub": token, "exp": far_future})
+    tokens.get("a")
+    tokens.put("c", {"sub": "c", "exp": far_future})
+
+    assert tokens.get("b") is None
+    assert tokens.get("a") is not None and tokens.get("c") is not None
+
+
+def test_cached_token_is_not_verified_again(monkeypatch):
+    token = create_access_token({"sub": "someone", "user_type": "customer"})
+    monkeypatch.setattr(security, "token_cache", TokenCache(max_entries=4))
+    payload = security.verify_access_token(token)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token verified twice")
+
+    monkeypatch.setattr(security.jwt, "decode", fail)
+    assert security.verify_access_token(token) == payload
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+from backend import serve
+
+
+def write(path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.mark.parametrize("cpu_max, quota", [
+    ("max 100000\n", None),
+    ("200000 100000\n", 2),
+    ("150000 100000\n", 2),
+    ("5000 100000\n", 1),
+])
+def test_cgroup_v2_quota(tmp_path, cpu_max, quota):
+    write(tmp_path / "cpu.max", cpu_max)
+    assert serve.cpu_quota(str(tmp_path)) == quota
+
+
+@pytest.mark.parametrize("cfs_quota, quota", [("-1\n", None), ("250000\n", 3)])
+def test_cgroup_v1_quota(tmp_path, cfs_quota, quota):
+    write(tmp_path / "cpu" / "cpu.cfs_quota_us", cfs_quota)
+    write(tmp_path / "cpu" / "cpu.cfs_period_us", "100000\n")
+    assert serve.cpu_quota(str(tmp_path)) == quota
+
+
+def test_no_cgroup_means_no_quota(tmp_path):
+    assert serve.cpu_quota(str(tmp_path)) is None
+
+
+@pytest.mark.parametrize("affinity, quota, cpus", [(8, None, 8), (8, 2, 2), (2, 4, 2)])
+def test_available_cpus_is_capped_by_the_quota(monkeypatch, affinity, quota, cpus):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(affinity)), raising=False)
+    monkeypatch.setattr(serve, "cpu_quota", lambda: quota)
+    assert serve.available_cpus() == cpus